@@ -1,8 +1,14 @@
 from typing import List, Dict
 from models.data_models import KeywordData, DimensionHierarchy
 from llm.deepseek_client import DeepSeekClient
+import io
 import re
 
+# Matches an indented hierarchy line ("  - item" / "    -- sub item").
+# Compiled once so line classification is a single C-level match instead
+# of a chain of strip/startswith calls per line.
+HIERARCHY_LINE_RE = re.compile(r'^(?P<indent>\s*)(?P<bullet>-+)\s*(?P<name>.+?)\s*$')
+
 
 class DimensionSynthesiser:
     """Synthesize dimensions from multiple keywords into unified hierarchy"""
@@ -22,7 +28,7 @@ class DimensionSynthesiser:
         
         try:
             print("Calling LLM...")
-            full_response = self.llm.complete(messages, temperature=0.3)
+            full_response = self.llm.complete(messages, temperature=0.3, cache=True)
             
             # Extract just the hierarchy part
             hierarchy_text = self._extract_hierarchy_from_response(full_response, key_word)
@@ -47,35 +53,34 @@ class DimensionSynthesiser:
         """Extract just the hierarchy structure from LLM response"""
         if not response:
             return ""
-        
-        # Look for the hierarchy structure
-        lines = response.strip().split('\n')
-        hierarchy_lines = []
+
+        # Accumulate accepted lines in a StringIO buffer instead of
+        # building intermediate lists and joining at the end
+        buf = io.StringIO()
         in_hierarchy = False
-        
-        for line in lines:
+
+        for line in response.splitlines():
             # Start capturing when we see the key word at the beginning
             if line.strip() == key_word or (not in_hierarchy and key_word.lower() in line.lower() and line.strip().startswith(key_word)):
                 in_hierarchy = True
-                hierarchy_lines.append(key_word)  # Ensure clean root
+                buf.write(key_word)  # Ensure clean root
+                buf.write('\n')
                 continue
-            
+
             # Stop capturing when we hit explanatory text
             if in_hierarchy:
-                # Check if this looks like hierarchy (starts with spaces or -)
-                if line.strip() and (line.startswith(' ') or line.startswith('-')):
-                    # Clean the line
-                    clean_line = line.rstrip()
-                    if clean_line.strip().startswith('-'):
-                        hierarchy_lines.append(clean_line)
+                # A single regex match decides hierarchy-line vs terminator
+                if HIERARCHY_LINE_RE.match(line):
+                    buf.write(line.rstrip())
+                    buf.write('\n')
                 elif line.strip() == '':
                     # Empty line might be end of hierarchy
                     continue
                 else:
                     # Non-indented, non-empty line = end of hierarchy
                     break
-        
-        return '\n'.join(hierarchy_lines)
+
+        return buf.getvalue().rstrip('\n')
     
     def _build_synthesis_prompt(self, key_word: str, keywords_data: List[KeywordData]) -> List[Dict]:
         """Build the prompt for dimension synthesis"""
@@ -139,8 +144,7 @@ DO NOT add any text before or after the hierarchy."""
     
     def visualize_hierarchy(self, hierarchy: DimensionHierarchy) -> str:
         """Create a visual representation of the hierarchy"""
-        if not hierarchy.structured:
-            hierarchy.parse_hierarchy()
+        hierarchy.ensure_parsed()
         
         lines = [f"🌳 {hierarchy.key_word}"]
         
@@ -1,10 +1,65 @@
 from typing import Dict, List, Tuple
 from models.data_models import DimensionHierarchy, ExtractedContent, DimensionScore, GapAnalysisResult
 from llm.deepseek_client import DeepSeekClient
+import asyncio
 import json
+import os
 from datetime import datetime
 import uuid
 
+# Number of dimension analyses to run against the LLM concurrently.
+# Tunable via environment without code changes.
+ANALYSIS_CONCURRENCY = int(os.getenv('ANALYSIS_CONCURRENCY', '8'))
+
+# Number of dimensions scored per LLM call. Batching amortises the shared
+# page content across dimensions and cuts total request count.
+ANALYSIS_BATCH_SIZE = int(os.getenv('ANALYSIS_BATCH_SIZE', '10'))
+
+# Number of URLs analyzed concurrently by analyze_many.
+MAX_PARALLEL_URLS = int(os.getenv('ANALYSIS_MAX_PARALLEL_URLS', '4'))
+
+# Token budget for the page content sample inside each prompt. Roughly
+# matches the old 3000-char cap at ~4 chars/token.
+MAX_CONTENT_TOKENS = int(os.getenv('ANALYSIS_CONTENT_TOKENS', '750'))
+
+# tiktoken gives an exact token count; without it we approximate with
+# the ~4 chars/token heuristic the old character cap assumed
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# The encoder is resolved lazily: get_encoding downloads the BPE file
+# on first use (it isn't bundled in the wheel), and a failed download -
+# offline box, CDN hiccup - must degrade to the heuristic, not crash
+# module import. _ENCODER_FAILED remembers a failure so each analysis
+# doesn't retry the download.
+_ENCODER = None
+_ENCODER_FAILED = tiktoken is None
+
+
+def _get_encoder():
+    """The cl100k_base encoder, or None when it can't be loaded"""
+    global _ENCODER, _ENCODER_FAILED
+    if _ENCODER is None and not _ENCODER_FAILED:
+        try:
+            _ENCODER = tiktoken.get_encoding('cl100k_base')
+        except Exception as e:
+            print(f"Warning: tiktoken encoding unavailable ({e}), using character heuristic")
+            _ENCODER_FAILED = True
+    return _ENCODER
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to a token budget (character heuristic fallback)"""
+    encoder = _get_encoder()
+    if encoder is None:
+        return text[:max_tokens * 4]
+    tokens = encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
 
 class GapAnalyser:
     """Analyze content gaps against dimension hierarchy"""
@@ -13,46 +68,119 @@ class GapAnalyser:
         self.llm = llm_client
     
     def analyze(
-        self, 
-        content: ExtractedContent, 
+        self,
+        content: ExtractedContent,
         hierarchy: DimensionHierarchy,
         key_word: str
     ) -> GapAnalysisResult:
         """
         Analyze how well content covers the dimension hierarchy
-        
+
+        Synchronous entry point for existing callers (CLI, Streamlit) -
+        runs the async analysis under the hood.
+
         Args:
             content: Extracted content from target page
             hierarchy: Synthesized dimension hierarchy
             key_word: Central keyword for context
-            
+
+        Returns:
+            GapAnalysisResult with scores and recommendations
+        """
+        return asyncio.run(self.analyze_async(content, hierarchy, key_word))
+
+    def analyze_many(
+        self,
+        contents: List[ExtractedContent],
+        hierarchy: DimensionHierarchy,
+        key_word: str
+    ) -> List[GapAnalysisResult]:
+        """
+        Analyze several pages against the same hierarchy concurrently
+
+        Useful for comparing competitor URLs - the hierarchy (and its
+        cached parent->children map) is shared across all analyses, and
+        URLs are processed in parallel up to MAX_PARALLEL_URLS.
+
+        Args:
+            contents: Extracted content for each target page
+            hierarchy: Synthesized dimension hierarchy
+            key_word: Central keyword for context
+
+        Returns:
+            One GapAnalysisResult per content, in input order
+        """
+        return asyncio.run(self.analyze_many_async(contents, hierarchy, key_word))
+
+    async def analyze_many_async(
+        self,
+        contents: List[ExtractedContent],
+        hierarchy: DimensionHierarchy,
+        key_word: str
+    ) -> List[GapAnalysisResult]:
+        """Async counterpart of analyze_many"""
+        url_semaphore = asyncio.Semaphore(MAX_PARALLEL_URLS)
+
+        async def run_one(content):
+            async with url_semaphore:
+                return await self.analyze_async(content, hierarchy, key_word)
+
+        return list(await asyncio.gather(*[run_one(content) for content in contents]))
+
+    async def analyze_async(
+        self,
+        content: ExtractedContent,
+        hierarchy: DimensionHierarchy,
+        key_word: str
+    ) -> GapAnalysisResult:
+        """
+        Analyze how well content covers the dimension hierarchy
+
+        Dimension analyses are independent LLM calls, so they are dispatched
+        concurrently with a semaphore bounding in-flight requests.
+
+        Args:
+            content: Extracted content from target page
+            hierarchy: Synthesized dimension hierarchy
+            key_word: Central keyword for context
+
         Returns:
             GapAnalysisResult with scores and recommendations
         """
         print(f"Analyzing content gaps for '{key_word}'...")
-        
+
         # Get all dimensions to analyze
         dimensions_to_analyze = self._get_dimensions_to_analyze(hierarchy)
-        
-        # Analyze each dimension
-        dimension_scores = []
-        for dim_path, dim_info in dimensions_to_analyze:
-            print("Analysing a new dimension")
-            score = self._analyze_dimension_coverage(
-                content, 
-                dim_path, 
-                dim_info,
-                hierarchy
-            )
-            dimension_scores.append(score)
-        
+
+        # Batch dimensions so each LLM call scores several against the same
+        # content, then dispatch batches concurrently, bounded by semaphore
+        batches = [
+            dimensions_to_analyze[i:i + ANALYSIS_BATCH_SIZE]
+            for i in range(0, len(dimensions_to_analyze), ANALYSIS_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+
+        # Request-scoped memo: duplicate prompts inside this one analysis
+        # (repeated paths in the hierarchy) are answered from memory.
+        # Dies with the analysis, unlike the client's persistent cache.
+        request_cache = {}
+
+        async def run_batch(dim_batch):
+            async with semaphore:
+                print(f"Analysing a batch of {len(dim_batch)} dimensions")
+                return await self._analyze_dimension_batch(
+                    content, dim_batch, hierarchy, request_cache
+                )
+
+        batch_results = await asyncio.gather(*[run_batch(batch) for batch in batches])
+        dimension_scores = [score for batch in batch_results for score in batch]
+
         # Calculate overall score
         overall_score = self._calculate_overall_score(dimension_scores)
-        
+
         # Generate insights
-        strengths, weaknesses = self._identify_strengths_weaknesses(dimension_scores)
-        recommendations = self._generate_recommendations(dimension_scores, hierarchy)
-        
+        strengths, weaknesses, recommendations = self._summarize_scores(dimension_scores)
+
         return GapAnalysisResult(
             analysis_id=str(uuid.uuid4()),
             created_at=datetime.now(),
@@ -69,45 +197,207 @@ class GapAnalyser:
         """Get list of dimension paths to analyze - only up to level 2"""
         dimensions = []
         
-        if not hierarchy.structured:
-            hierarchy.parse_hierarchy()
-        
-        # Build a map of parent -> children for easy lookup
-        parent_children_map = {}
-        for item in hierarchy.structured:
-            if item['level'] > 0:  # Skip root
-                path_parts = item['path'].split(' > ')
-                if len(path_parts) > 1:
-                    parent_path = ' > '.join(path_parts[:-1])
-                    if parent_path not in parent_children_map:
-                        parent_children_map[parent_path] = []
-                    parent_children_map[parent_path].append(item)
-        
+        hierarchy.ensure_parsed()
+
+        # Parent -> children lookup is cached on the hierarchy object;
+        # bind lookups to locals so the loop body stays LOAD_FAST
+        children_for = hierarchy.parent_children_map().get
+        append = dimensions.append
+
         # Only analyze dimensions up to level 2
         for item in hierarchy.structured:
             if 0 < item['level'] <= 2:  # Skip root (0) and level 3+
                 # Add children info to the dimension
-                children = parent_children_map.get(item['path'], [])
-                item['children'] = children
-                dimensions.append((item['path'], item))
-        
+                path = item['path']
+                item['children'] = children_for(path, [])
+                append((path, item))
+
         return dimensions
     
-    def _analyze_dimension_coverage(
-        self, 
+    async def _analyze_dimension_batch(
+        self,
+        content: ExtractedContent,
+        dim_batch: List[Tuple[str, Dict]],
+        hierarchy: DimensionHierarchy,
+        request_cache: Dict = None
+    ) -> List[DimensionScore]:
+        """Analyze how well content covers a batch of dimensions in one call"""
+
+        # Build prompt covering the whole batch
+        messages = self._build_batched_analysis_prompt(content, dim_batch, hierarchy)
+
+        cache_key = None
+        if request_cache is not None:
+            cache_key = (messages[0]['content'], messages[1]['content'])
+            cached = request_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            # Cascade: a configured fast model scores first; malformed
+            # answers escalate to the stronger default model
+            response = await self.llm.acomplete_json_cascade(
+                messages, validate=self._is_valid_batch_response,
+                temperature=0.3, cache=True
+            )
+
+            # The model may wrap the array in an object key
+            if isinstance(response, dict):
+                for value in response.values():
+                    if isinstance(value, list):
+                        response = value
+                        break
+
+            if not isinstance(response, list):
+                raise ValueError(f"Expected JSON array of scores, got {type(response).__name__}")
+
+            # Index entries by dimension path so missing/reordered entries are handled
+            entries_by_path = {}
+            for entry in response:
+                if isinstance(entry, dict) and 'dimension_path' in entry:
+                    entries_by_path[entry['dimension_path']] = entry
+
+            scores = []
+            for dim_path, dim_info in dim_batch:
+                entry = entries_by_path.get(dim_path)
+                if entry is None:
+                    print(f"Warning: No score returned for {dim_path}, defaulting to 0")
+                    scores.append(DimensionScore(
+                        dimension_path=dim_path,
+                        score=0,
+                        reasoning="No score returned by model"
+                    ))
+                    continue
+
+                score = entry.get('score', 0)
+                reasoning = entry.get('reasoning', 'No reasoning provided')
+                child_coverage = entry.get('child_coverage', None)
+
+                # Validate score
+                if score not in [0, 25, 50, 75, 100]:
+                    print(f"Warning: Invalid score {score} for {dim_path}, defaulting to 0")
+                    score = 0
+
+                scores.append(DimensionScore(
+                    dimension_path=dim_path,
+                    score=score,
+                    reasoning=reasoning,
+                    child_coverage=child_coverage
+                ))
+
+            if cache_key is not None:
+                request_cache[cache_key] = scores
+            return scores
+
+        except RuntimeError:
+            # Infrastructure failures (event-loop/transport teardown) are
+            # bugs, not model misbehaviour - surface them instead of
+            # reporting every dimension in the batch as missing
+            raise
+        except Exception as e:
+            print(f"Error analyzing batch: {str(e)}")
+            return [
+                DimensionScore(
+                    dimension_path=dim_path,
+                    score=0,
+                    reasoning=f"Analysis failed: {str(e)}"
+                )
+                for dim_path, dim_info in dim_batch
+            ]
+
+    @staticmethod
+    def _is_valid_batch_response(response) -> bool:
+        """Check a batch-scoring response is a usable array of entries"""
+        if isinstance(response, dict):
+            response = next(
+                (value for value in response.values() if isinstance(value, list)),
+                None
+            )
+        return isinstance(response, list) and all(
+            isinstance(entry, dict) and 'dimension_path' in entry
+            for entry in response
+        )
+
+    def _build_batched_analysis_prompt(
+        self,
+        content: ExtractedContent,
+        dim_batch: List[Tuple[str, Dict]],
+        hierarchy: DimensionHierarchy
+    ) -> List[Dict]:
+        """Build a single prompt that scores several dimensions at once"""
+
+        system_prompt = """You are analyzing how well a webpage covers a set of topics/dimensions.
+
+    SCORING CRITERIA:
+    - 100 = Excellent: Comprehensive coverage, all or most sub-topics covered with detail
+    - 75 = Good: Clear coverage with good detail, most sub-topics mentioned
+    - 50 = Average: Basic coverage, about half of sub-topics covered
+    - 25 = Poor: Minimal mention, few sub-topics covered
+    - 0 = Missing: No evidence of this topic
+
+    When a dimension has sub-topics (children), base your score primarily on how many and how well those sub-topics are covered in the content.
+
+    Return a JSON array with one entry per dimension, in the same order:
+    [
+        {
+            "dimension_path": "<path exactly as given>",
+            "score": <0|25|50|75|100>,
+            "reasoning": "<brief explanation>",
+            "child_coverage": "<X/Y subtopics covered>" // only if dimension has children
+        },
+        ...
+    ]"""
+
+        # Get content summary (shared across all dimensions in the batch)
+        content_text = _truncate_to_tokens(content.text_preview, MAX_CONTENT_TOKENS)
+
+        dimension_lines = []
+        for i, (dim_path, dim_info) in enumerate(dim_batch, 1):
+            children = dim_info.get('children', [])
+            children_names = [child['name'] for child in children]
+            if children_names:
+                dimension_lines.append(
+                    f"{i}. \"{dim_path}\" — sub-topics to check for: {', '.join(children_names)}"
+                )
+            else:
+                dimension_lines.append(f"{i}. \"{dim_path}\" — leaf dimension with no sub-topics")
+
+        user_prompt = f"""Analyze how well this content covers each of the dimensions below.
+
+    CONTENT FROM PAGE:
+    Title: {content.title}
+    Meta: {content.meta_description}
+
+    Main Content Sample:
+    {content_text}
+
+    DIMENSIONS TO ANALYZE:
+    {chr(10).join(dimension_lines)}
+
+    For dimensions with sub-topics, check how many and how well the sub-topics are covered. For leaf dimensions, score how well that specific topic is covered.
+
+    Score each dimension and provide reasoning. Return one JSON array entry per dimension."""
+
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    async def _analyze_dimension_coverage(
+        self,
         content: ExtractedContent,
         dim_path: str,
         dim_info: Dict,
         hierarchy: DimensionHierarchy
     ) -> DimensionScore:
         """Analyze how well content covers a specific dimension"""
-        
+
         # Build prompt for LLM
         messages = self._build_analysis_prompt(content, dim_path, dim_info, hierarchy)
-        
+
         # Get analysis from LLM
         try:
-            response = self.llm.complete_json(messages, temperature=0.3)
+            response = await self.llm.acomplete_json(messages, temperature=0.3, cache=True)
             
             # Extract score and reasoning
             score = response.get('score', 0)
@@ -126,6 +416,10 @@ class GapAnalyser:
                 child_coverage=child_coverage
             )
             
+        except RuntimeError:
+            # As in _analyze_dimension_batch: infrastructure failures
+            # propagate rather than masquerading as a zero score
+            raise
         except Exception as e:
             print(f"Error analyzing {dim_path}: {str(e)}")
             return DimensionScore(
@@ -162,12 +456,20 @@ class GapAnalyser:
     }"""
 
         # Get content summary
-        content_text = content.get_all_text()[:3000]  # Limit for prompt
+        content_text = _truncate_to_tokens(content.text_preview, MAX_CONTENT_TOKENS)
         
         # Get children from dim_info
         children = dim_info.get('children', [])
         children_names = [child['name'] for child in children]
         
+        # Hoist the conditional fragments so only the needed strings are built
+        if children_names:
+            subtopics_line = f"SUB-TOPICS TO CHECK FOR: {', '.join(children_names)}"
+            scoring_line = "For scoring, check how many and how well the sub-topics are covered in the content."
+        else:
+            subtopics_line = "This is a leaf dimension with no sub-topics."
+            scoring_line = "Score based on how well this specific topic is covered."
+
         user_prompt = f"""Analyze how well this content covers the dimension: "{dim_path}"
 
     CONTENT FROM PAGE:
@@ -178,9 +480,9 @@ class GapAnalyser:
     {content_text}
 
     DIMENSION TO ANALYZE: {dim_path}
-    {f"SUB-TOPICS TO CHECK FOR: {', '.join(children_names)}" if children_names else "This is a leaf dimension with no sub-topics."}
+    {subtopics_line}
 
-    {"For scoring, check how many and how well the sub-topics are covered in the content." if children_names else "Score based on how well this specific topic is covered."}
+    {scoring_line}
 
     Score the coverage and provide reasoning."""
 
@@ -198,61 +500,64 @@ class GapAnalyser:
         total_score = sum(ds.score for ds in dimension_scores)
         return round(total_score / len(dimension_scores), 1)
     
-    def _identify_strengths_weaknesses(
-        self, 
+    def _summarize_scores(
+        self,
         dimension_scores: List[DimensionScore]
-    ) -> Tuple[List[str], List[str]]:
-        """Identify content strengths and weaknesses"""
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """Identify strengths, weaknesses and recommendations in one pass"""
         strengths = []
         weaknesses = []
-        
+        missing = []
+        poor = []
+        average = []
+        any_basic = False
+        any_shallow = False
+
+        # Single pass buckets every score for all three outputs
         for ds in dimension_scores:
             if ds.score >= 75:
-                strengths.append(f"Strong coverage of {ds.dimension_path.split(' > ')[-1]}")
+                strengths.append(f"Strong coverage of {ds.leaf_name}")
             elif ds.score <= 25:
-                weaknesses.append(f"Weak/missing coverage of {ds.dimension_path.split(' > ')[-1]}")
-        
+                weaknesses.append(f"Weak/missing coverage of {ds.leaf_name}")
+
+            if ds.score >= 50:
+                any_basic = True
+            else:
+                any_shallow = True
+
+            if ds.score == 0:
+                missing.append(ds)
+            elif ds.score == 25:
+                poor.append(ds)
+            elif ds.score == 50:
+                average.append(ds)
+
         # If no specific strengths/weaknesses, add general ones
-        if not strengths:
-            if any(ds.score >= 50 for ds in dimension_scores):
-                strengths.append("Some topics covered at a basic level")
-        
-        if not weaknesses:
-            if any(ds.score < 50 for ds in dimension_scores):
-                weaknesses.append("Several topics need more depth")
-        
-        return strengths, weaknesses
-    
-    def _generate_recommendations(
-        self,
-        dimension_scores: List[DimensionScore],
-        hierarchy: DimensionHierarchy
-    ) -> List[str]:
-        """Generate actionable recommendations"""
+        if not strengths and any_basic:
+            strengths.append("Some topics covered at a basic level")
+
+        if not weaknesses and any_shallow:
+            weaknesses.append("Several topics need more depth")
+
         recommendations = []
-        
-        # Group by score level
-        missing = [ds for ds in dimension_scores if ds.score == 0]
-        poor = [ds for ds in dimension_scores if ds.score == 25]
-        average = [ds for ds in dimension_scores if ds.score == 50]
-        
+
         # Priority 1: Add missing content
         if missing:
-            topics = [ds.dimension_path.split(' > ')[-1] for ds in missing[:3]]
+            topics = [ds.leaf_name for ds in missing[:3]]
             recommendations.append(f"Add sections covering: {', '.join(topics)}")
-        
+
         # Priority 2: Improve poor coverage
         if poor:
-            topics = [ds.dimension_path.split(' > ')[-1] for ds in poor[:3]]
+            topics = [ds.leaf_name for ds in poor[:3]]
             recommendations.append(f"Expand content on: {', '.join(topics)}")
-        
+
         # Priority 3: Enhance average coverage
         if average and len(recommendations) < 3:
-            topics = [ds.dimension_path.split(' > ')[-1] for ds in average[:2]]
+            topics = [ds.leaf_name for ds in average[:2]]
             recommendations.append(f"Add more detail to: {', '.join(topics)}")
-        
+
         # Add a general recommendation if needed
         if not recommendations:
             recommendations.append("Content covers most topics well - consider adding more examples and case studies")
-        
-        return recommendations[:5]  # Limit to 5 recommendations
\ No newline at end of file
+
+        return strengths, weaknesses, recommendations[:5]  # Limit to 5 recommendations
\ No newline at end of file
@@ -3,6 +3,24 @@ from typing import List, Dict
 import re
 import json
 
+# Prefer the C-based lxml parser when available - it's an order of
+# magnitude faster than the pure-Python html.parser on multi-KB AIO blobs
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
+
+# Single C-level translate pass: map non-breaking spaces to plain spaces
+# and drop zero-width characters that leak out of AIO markup
+CLEAN_TABLE = str.maketrans({
+    '\xa0': ' ',       # non-breaking space
+    '\u200b': None,    # zero-width space
+    '\u200c': None,    # zero-width non-joiner
+    '\u200d': None,    # zero-width joiner
+    '\ufeff': None,    # byte-order mark
+})
+
 
 class AIOExtractor:
     """Extract dimensions (headings) from AIO HTML content with hierarchy preserved"""
@@ -23,7 +41,7 @@ class AIOExtractor:
             # Unescape newlines if present
             aio_html = aio_html.replace('\\n', '\n')
         
-        soup = BeautifulSoup(aio_html, 'html.parser')
+        soup = BeautifulSoup(aio_html, BS_PARSER)
         
         # Debug: Check if parsing worked
         test_divs = soup.find_all('div', class_='WaaZC')
@@ -61,11 +79,12 @@ class AIOExtractor:
         """Clean and normalize text"""
         if not text:
             return ""
-        
+
+        # Normalize whitespace look-alikes in one translate pass
+        text = text.translate(CLEAN_TABLE)
+
         # Remove extra whitespace
         text = ' '.join(text.split())
-        
+
         # Remove trailing colons
-        text = text.rstrip(':')
-        
-        return text.strip()
\ No newline at end of file
+        return text.rstrip(':').strip()
\ No newline at end of file
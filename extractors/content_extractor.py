@@ -1,4 +1,8 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import hashlib
+import json
 from .page_fetcher import PageFetcher
 from .hierarchical_scraper import HierarchicalScraper
 from models.data_models import ExtractedContent
@@ -6,39 +10,132 @@ from models.data_models import ExtractedContent
 
 class ContentExtractor:
     """Orchestrates URL fetching and content extraction"""
-    
-    def __init__(self, delay_range=(1, 3), max_retries=3):
+
+    def __init__(self, delay_range=(1, 3), max_retries=3, cache_dir=None):
         self.fetcher = PageFetcher(delay_range=delay_range, max_retries=max_retries)
         self.scraper = HierarchicalScraper()
-    
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
     def extract_from_url(self, url: str) -> ExtractedContent:
         """
         Extract structured content from a URL
-        
+
         Args:
             url: Target URL to analyze
-            
+
         Returns:
             ExtractedContent object with structured page data
-            
+
         Raises:
             ValueError: If URL fetch fails or content is empty
         """
         # Add URL and fetch
         self.fetcher.add_pages(url)
         self.fetcher.fetch_url(url)
-        
-        # Get BeautifulSoup object
-        soup = self.fetcher.get_soup(url)
+
+        # If the page hasn't changed since it was cached, skip re-parsing
+        etag = self.fetcher.get_etag(url)
+        cached = self._load_cached_content(url, etag)
+        if cached:
+            print(f"Using cached extraction for {url}")
+            return cached
+
+        # Head and body regions are parsed separately, each with its own
+        # minimal strainer
+        metadata = self.fetcher.get_metadata(url)
+        soup = self.fetcher.get_body_soup(url)
         if not soup:
             raise ValueError(f"Failed to fetch content from {url}")
-        
+
         # Extract structure using hierarchical scraper
         structure = self.scraper.extract_structure(soup, url)
-        
+        if metadata:
+            structure['title'] = metadata['title']
+            structure['meta_description'] = metadata['meta_description']
+
         # Convert to our data model
-        return self._convert_to_extracted_content(url, structure)
+        content = self._convert_to_extracted_content(url, structure)
+        self._store_cached_content(url, etag, content)
+        return content
+
+    def _cache_path(self, url: str) -> Path:
+        """Cache file path for a URL"""
+        url_hash = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{url_hash}.json"
+
+    def _load_cached_content(self, url: str, etag: Optional[str]) -> Optional[ExtractedContent]:
+        """Load cached extraction if the stored ETag still matches"""
+        if not self.cache_dir or not etag:
+            return None
+
+        cache_file = self._cache_path(url)
+        if not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+        if cached.get('etag') != etag:
+            return None
+
+        data = cached['content']
+        return ExtractedContent(
+            url=data['url'],
+            title=data['title'],
+            meta_description=data['meta_description'],
+            content_blocks=data['content_blocks']
+        )
+
+    def _store_cached_content(self, url: str, etag: Optional[str], content: ExtractedContent):
+        """Persist an extraction for reuse while the page's ETag is stable"""
+        if not self.cache_dir or not etag:
+            return
+
+        cached = {
+            'etag': etag,
+            'content': {
+                'url': content.url,
+                'title': content.title,
+                'meta_description': content.meta_description,
+                'content_blocks': content.content_blocks
+            }
+        }
+        try:
+            with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                json.dump(cached, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: could not write extraction cache for {url}: {e}")
     
+    def extract_from_urls(self, urls: List[str], max_workers: int = 5) -> List[Optional[ExtractedContent]]:
+        """
+        Extract structured content from several URLs concurrently
+
+        Fetching is network-bound, so URLs are processed in a thread pool
+        and the per-URL fetch/parse work overlaps. Failed URLs yield None
+        rather than aborting the whole batch.
+
+        Args:
+            urls: Target URLs to analyze
+            max_workers: Maximum concurrent fetches
+
+        Returns:
+            One ExtractedContent (or None on failure) per URL, in input order
+        """
+        def extract_one(url: str) -> Optional[ExtractedContent]:
+            try:
+                return self.extract_from_url(url)
+            except Exception as e:
+                print(f"Failed to extract {url}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(extract_one, urls))
+
     def _convert_to_extracted_content(self, url: str, structure: Dict) -> ExtractedContent:
         """
         Convert scraper output to ExtractedContent model
@@ -1,14 +1,37 @@
-from bs4 import BeautifulSoup, NavigableString, Tag
-from urllib.parse import urlparse, urljoin
+from functools import lru_cache
+from urllib.parse import urlparse
 import json
 
+# orjson's Rust encoder is 5-10x faster than stdlib json for the large
+# nested structures this module exports; fall back to stdlib if absent
+try:
+    import orjson
+
+    def _dumps_indented(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps_indented(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(href):
+    """urlparse with memoization - pages repeat the same hrefs a lot."""
+    return urlparse(href)
+
 
 class HierarchicalScraper:
     """
     Extracts hierarchical structure from HTML pages, maintaining order
     and relationships between headings and their content.
     """
-    
+
+    # frozensets give bs4's multi-name matcher (and our own membership
+    # checks) O(1) lookups instead of scanning a list per element
+    RELEVANT_TAGS = frozenset({'h1', 'h2', 'h3', 'p', 'a', 'button', 'input'})
+    HEADING_TAGS = frozenset({'h1', 'h2', 'h3'})
+
+
     def __init__(self, base_url=None):
         """
         Initialize the scraper.
@@ -70,22 +93,27 @@ class HierarchicalScraper:
             
         navigation_links = []
         navigation_buttons = []
-        
+        # Sets mirror the ordered lists so dedup stays O(1) per item
+        links_seen = set()
+        buttons_seen = set()
+
         for nav_element in nav_elements:
             # Extract links
             links = nav_element.find_all('a')
             for link in links:
                 href = link.get('href', '')
                 if href and self._is_internal_link(href):
-                    link_text = link.get_text().strip()
-                    if link_text and len(link_text) < 50 and link_text not in navigation_links:
+                    link_text = link.get_text(strip=True)
+                    if link_text and len(link_text) < 50 and link_text not in links_seen:
+                        links_seen.add(link_text)
                         navigation_links.append(link_text)
-            
+
             # Extract buttons
             buttons = nav_element.find_all(['button'], limit=10)
             for button in buttons:
-                button_text = button.get_text().strip()
-                if button_text and len(button_text) < 50 and button_text not in navigation_buttons:
+                button_text = button.get_text(strip=True)
+                if button_text and len(button_text) < 50 and button_text not in buttons_seen:
+                    buttons_seen.add(button_text)
                     navigation_buttons.append(button_text)
         
         # Only create navigation block if we found items
@@ -105,7 +133,7 @@ class HierarchicalScraper:
     def _get_title(self, soup):
         """Extract page title."""
         title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else None
+        return title_tag.get_text(strip=True) if title_tag else None
     
     def _get_meta_description(self, soup):
         """Extract meta description."""
@@ -114,26 +142,23 @@ class HierarchicalScraper:
             meta_desc = soup.find('meta', attrs={'property': 'og:description'})
         return meta_desc.get('content', '').strip() if meta_desc else None
 
-    
-    def _is_footer_content(self, element):
+    def _has_footer_classed_parent(self, element):
         """
-        Detect if an element is part of footer content.
-        
+        Check whether the immediate parent carries a footer-related class.
+
+        Constant-time check used by the main traversal, which resolves
+        footer *tag* membership via a precomputed id set instead of
+        walking ancestors.
+
         Returns:
-            bool: True if element is in footer
+            bool: True if the immediate parent looks like footer markup
         """
-        # Check if element is within a footer tag
-        footer_parent = element.find_parent('footer')
-        if footer_parent:
-            return True
-        
-        # Check for footer-related classes in immediate parent only
         parent = element.parent
         if parent and parent.get('class'):
             classes = ' '.join(parent.get('class')).lower()
             if 'footer' in classes:
                 return True
-        
+
         return False
     
     def _traverse_dom_sequentially(self, soup, nav_elements=None):
@@ -150,48 +175,60 @@ class HierarchicalScraper:
         content_blocks = []
         current_block = None
         current_level = None
-        
+
         # Get the body or use the whole soup if no body
         body = soup.body if soup.body else soup
-        
+
+        # Precompute nav descendants once so the per-element check is an
+        # O(1) set lookup instead of re-walking each nav subtree
+        nav_descendant_ids = set()
+        if nav_elements:
+            for nav in nav_elements:
+                if nav:
+                    nav_descendant_ids.update(id(d) for d in nav.descendants)
+
+        # Same for footer subtrees - one pass here replaces a
+        # find_parent('footer') ancestor walk per element
+        footer_descendant_ids = set()
+        for footer in body.find_all('footer'):
+            footer_descendant_ids.add(id(footer))
+            footer_descendant_ids.update(id(d) for d in footer.descendants)
+
         # Find all relevant elements in order
-        relevant_tags = ['h1', 'h2', 'h3', 'p', 'a', 'button', 'input']
-        all_elements = body.find_all(relevant_tags)
-        
+        all_elements = body.find_all(self.RELEVANT_TAGS)
+        heading_tags = self.HEADING_TAGS
+
         for element in all_elements:
             # Skip if element is within navigation elements
-            if nav_elements:
-                skip = False
-                for nav in nav_elements:
-                    if nav and element in nav.descendants:
-                        skip = True
-                        break
-                if skip:
-                    continue
+            if id(element) in nav_descendant_ids:
+                continue
             
             # Skip footer content
-            if self._is_footer_content(element):
+            if id(element) in footer_descendant_ids or self._has_footer_classed_parent(element):
                 continue
-            
-            if element.name in ['h1', 'h2', 'h3']:
+
+            if element.name in heading_tags:
                 # Save previous block if exists
                 if current_block:
                     content_blocks.append(self._clean_block(current_block))
                 
-                # Start new block
+                # Start new block; the _seen sets back O(1) dedup and are
+                # dropped again by _clean_block
                 current_level = element.name
                 current_block = {
                     'level': current_level,
-                    'heading': element.get_text().strip(),
+                    'heading': element.get_text(strip=True),
                     'links': [],
                     'buttons': [],
-                    'paragraphs': []
+                    'paragraphs': [],
+                    '_links_seen': set(),
+                    '_buttons_seen': set()
                 }
             
             elif current_block:  # Only process if we have a current heading context
                 if element.name == 'p' and current_level == 'h1':
                     # Only collect paragraphs under h1
-                    text = element.get_text().strip()
+                    text = element.get_text(strip=True)
                     if text:
                         current_block['paragraphs'].append(text)
                 
@@ -199,28 +236,46 @@ class HierarchicalScraper:
                     # Check if it's an internal link
                     href = element.get('href', '')
                     if href and self._is_internal_link(href):
-                        link_text = element.get_text().strip()
-                        if link_text and link_text not in current_block['links']:
-                            current_block['links'].append(link_text)
+                        link_text = element.get_text(strip=True)
+                        if link_text:
+                            # Button-styled links belong with buttons;
+                            # classifying here avoids a backward-search
+                            # second pass over the whole tree
+                            if self._is_button_styled(element):
+                                if (link_text not in current_block['_buttons_seen']
+                                        and link_text not in current_block['_links_seen']):
+                                    current_block['_buttons_seen'].add(link_text)
+                                    current_block['buttons'].append(link_text)
+                            elif link_text not in current_block['_links_seen']:
+                                current_block['_links_seen'].add(link_text)
+                                current_block['links'].append(link_text)
                 
                 elif element.name == 'button':
-                    button_text = element.get_text().strip()
-                    if button_text and button_text not in current_block['buttons']:
+                    button_text = element.get_text(strip=True)
+                    if button_text and button_text not in current_block['_buttons_seen']:
+                        current_block['_buttons_seen'].add(button_text)
                         current_block['buttons'].append(button_text)
-                
+
                 elif element.name == 'input' and element.get('type') in ['button', 'submit']:
                     button_text = element.get('value', '').strip()
-                    if button_text and button_text not in current_block['buttons']:
+                    if button_text and button_text not in current_block['_buttons_seen']:
+                        current_block['_buttons_seen'].add(button_text)
                         current_block['buttons'].append(button_text)
         
         # Don't forget the last block
         if current_block:
             content_blocks.append(self._clean_block(current_block))
-        
-        # Also check for link-styled buttons within each block's section
-        self._find_link_buttons(body, content_blocks)
-        
+
         return content_blocks
+
+    def _is_button_styled(self, element):
+        """Check whether a link carries button-like styling classes."""
+        classes = element.get('class')
+        if not classes:
+            return False
+        # 'btn' is a substring of 'button', so one scan covers both; no
+        # join allocation per element
+        return any('btn' in c.lower() for c in classes)
     
     def _clean_block(self, block):
         """
@@ -261,17 +316,25 @@ class HierarchicalScraper:
         """
         if not href:
             return False
-        
+
         # Anchor links are internal
         if href.startswith('#'):
             return True
-        
+
         # Relative links are internal
         if href.startswith('/'):
             return True
-        
-        # Parse the URL
-        parsed = urlparse(href)
+
+        # Cheap C-level prefix checks cover the vast majority of hrefs
+        # before paying for a urlparse
+        if href.startswith(('mailto:', 'tel:', 'javascript:', 'data:', 'ftp:')):
+            return False
+        if self.base_domain and href.startswith(
+                (f'http://{self.base_domain}/', f'https://{self.base_domain}/')):
+            return True
+
+        # Parse the URL (cached - nav links repeat across blocks)
+        parsed = _parse_url(href)
         
         # No scheme means relative link
         if not parsed.scheme:
@@ -287,48 +350,6 @@ class HierarchicalScraper:
         
         return False
     
-    def _find_link_buttons(self, soup, content_blocks):
-        """
-        Find links that are styled as buttons and add them to the appropriate blocks.
-        This is a second pass to catch button-styled links.
-        """
-        # Find all links with button-like classes
-        button_links = soup.find_all('a', class_=lambda x: x and any(
-            btn in ' '.join(x).lower() for btn in ['btn', 'button']
-        ))
-        
-        for link in button_links:
-            # Skip footer content
-            if self._is_footer_content(link):
-                continue
-                
-            # Skip if not internal
-            href = link.get('href', '')
-            if not self._is_internal_link(href):
-                continue
-            
-            button_text = link.get_text().strip()
-            if not button_text:
-                continue
-            
-            # Find which block this button belongs to
-            # by finding the nearest preceding heading
-            for element in link.find_all_previous(['h1', 'h2', 'h3']):
-                heading_text = element.get_text().strip()
-                # Find the matching block
-                for i, block in enumerate(content_blocks):
-                    if block.get('heading') == heading_text:
-                        # Check if this button is already in links or buttons
-                        existing_links = block.get('links', [])
-                        existing_buttons = block.get('buttons', [])
-                        
-                        if button_text not in existing_links and button_text not in existing_buttons:
-                            if 'buttons' not in content_blocks[i]:
-                                content_blocks[i]['buttons'] = []
-                            content_blocks[i]['buttons'].append(button_text)
-                        break
-                break
-    
     def extract_structure_json(self, soup, base_url=None):
         """
         Extract structure and return as formatted JSON string.
@@ -341,4 +362,4 @@ class HierarchicalScraper:
             str: JSON formatted structure
         """
         structure = self.extract_structure(soup, base_url)
-        return json.dumps(structure, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return _dumps_indented(structure)
\ No newline at end of file
@@ -1,9 +1,74 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+import logging
+import re
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse
 
+# httpx gives true async fetching (one thread multiplexing all requests
+# on the event loop); without it fetch_all falls back to the thread pool
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['PageFetcher']
+
+
+@lru_cache(maxsize=1024)
+def _url_domain(url):
+    """Domain of a URL, memoized - the same URLs are parsed repeatedly."""
+    return urlparse(url).netloc
+
+# Prefer the C-based lxml parser when available - same tree API, 5-10x
+# faster than the pure-Python html.parser on full pages
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
+
+# The only tags HierarchicalScraper reads; parsing with this strainer
+# skips tree construction for every other element on the page
+RELEVANT_TAGS = SoupStrainer([
+    'title', 'meta', 'nav', 'header', 'footer',
+    'h1', 'h2', 'h3', 'p', 'a', 'button', 'input'
+])
+
+# For callers that only need page metadata, parsing just these two tags
+# is orders of magnitude cheaper than building any content tree
+HEAD_TAGS = SoupStrainer(['title', 'meta'])
+
+# Body-side counterpart: everything the scraper reads except title/meta.
+# Splitting the document at </head> and parsing each region with its own
+# strainer beats one parse with the combined strainer
+BODY_TAGS = SoupStrainer([
+    'nav', 'header', 'footer',
+    'h1', 'h2', 'h3', 'p', 'a', 'button', 'input'
+])
+
+# The strainer drops container elements, which would also drop a
+# non-semantic footer wrapper (<div class="footer...">) and blind the
+# scraper's footer-class parent check. A cheap scan of the raw markup
+# decides whether such a wrapper exists; only then is the strained
+# parse traded for a full one that keeps the container as a parent.
+# (<footer ...> itself survives the strainer, so it's excluded here.)
+_FOOTER_CLASSED_RE = re.compile(
+    rb'<(?!footer[\s>])\w[^>]*class\s*=\s*["\'][^"\']*footer', re.IGNORECASE
+)
+_FOOTER_CLASSED_RE_STR = re.compile(
+    r'<(?!footer[\s>])\w[^>]*class\s*=\s*["\'][^"\']*footer', re.IGNORECASE
+)
+
 
 class PageFetcher:
     """
@@ -11,34 +76,51 @@ class PageFetcher:
     Includes rate limiting protection and retry logic.
     """
     
-    def __init__(self, urls=None, delay_range=(1, 3), max_retries=3):
+    def __init__(self, urls=None, delay_range=(1, 3), max_retries=3, keep_html=False):
         """
         Initialize the PageFetcher with optional URLs.
-        
+
         Args:
             urls (list, optional): List of URLs to fetch
             delay_range (tuple): Min and max seconds to wait between requests (min, max)
             max_retries (int): Maximum number of retry attempts for failed requests
+            keep_html (bool): Keep raw HTML bytes after parsing. Off by
+                default - once a page is parsed the bytes are replaced
+                with a fetched-ok sentinel, cutting peak memory on large
+                batches (the parsed soup stays cached)
         """
         self.pages = {}
         self.delay_range = delay_range
         self.max_retries = max_retries
+        self.keep_html = keep_html
         self.last_request_time = {}  # Track last request time per domain
+        self.response_headers = {}  # Response headers per fetched URL
+        self._soup_cache = {}  # (url, strained) -> parsed BeautifulSoup
         
         # Headers to appear more like a real browser
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            # Removed Accept-Encoding to avoid compression issues with some servers
+            # brotli is installed, so br responses (most CDNs prefer it)
+            # decode transparently and cut bytes on the wire
+            'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
         
-        # Session for connection pooling
+        # Session for connection pooling. Default adapters cap the pool
+        # at 10 connections; deepen it so concurrent fetch workers reuse
+        # warm TCP/TLS connections instead of rebuilding them. Retries
+        # stay in our own ladder, so urllib3's are disabled.
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.session.max_redirects = 5
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=Retry(total=0))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         if urls:
             self.add_pages(urls)
@@ -65,41 +147,157 @@ class PageFetcher:
         """
         if url not in self.pages:
             self.pages[url] = None
-            print(f"URL added: {url}")
+            logger.debug(f"URL added: {url}")
         else:
-            print(f"URL already exists: {url}")
+            logger.debug(f"URL already exists: {url}")
     
     def _get_domain(self, url):
         """Extract domain from URL for rate limiting per domain."""
-        return urlparse(url).netloc
+        return _url_domain(url)
     
     def _apply_rate_limit(self, url):
         """Apply rate limiting based on domain."""
         domain = self._get_domain(url)
-        
+
+        # First request to a domain needs no delay - only repeat visits
+        # pay the min-delay plus a random human-like pause
         if domain in self.last_request_time:
             elapsed = time.time() - self.last_request_time[domain]
             min_delay = self.delay_range[0]
-            
+
             if elapsed < min_delay:
                 sleep_time = min_delay - elapsed
-                print(f"Rate limiting: waiting {sleep_time:.2f}s before request to {domain}")
+                logger.debug(f"Rate limiting: waiting {sleep_time:.2f}s before request to {domain}")
                 time.sleep(sleep_time)
-        
-        # Add random delay to appear more human-like
-        random_delay = random.uniform(self.delay_range[0], self.delay_range[1])
-        time.sleep(random_delay)
-        
+
+                # Add random delay to appear more human-like
+                time.sleep(random.uniform(self.delay_range[0], self.delay_range[1]))
+
         # Update last request time
         self.last_request_time[domain] = time.time()
     
     def fetch_all(self):
         """
         Fetch HTML content for all URLs that haven't been fetched yet.
+
+        With httpx installed all URLs are fetched on a single event loop
+        (no thread per in-flight request); otherwise URLs are grouped by
+        domain and the groups fetched by a thread pool. Either way the
+        per-domain rate limiting stays sequential while different domains
+        overlap their network waits.
         """
-        for url in self.pages:
-            if self.pages[url] is None:
+        pending = [url for url, html in self.pages.items() if html is None]
+        if not pending:
+            return
+
+        if HTTPX_AVAILABLE and len(pending) > 1:
+            asyncio.run(self._fetch_all_async(pending))
+            return
+
+        # Group by domain; each group is fetched in order by one worker
+        domain_groups = {}
+        for url in pending:
+            domain_groups.setdefault(self._get_domain(url), []).append(url)
+
+        if len(domain_groups) == 1:
+            for url in pending:
+                self._fetch_html(url)
+            return
+
+        def fetch_group(urls):
+            for url in urls:
                 self._fetch_html(url)
+
+        with ThreadPoolExecutor(max_workers=min(32, len(domain_groups))) as executor:
+            list(executor.map(fetch_group, domain_groups.values()))
+
+    async def _fetch_all_async(self, urls):
+        """Fetch a batch of URLs concurrently on one httpx AsyncClient."""
+        domain_locks = {}
+        async with httpx.AsyncClient(headers=self.headers, timeout=30,
+                                     follow_redirects=True) as client:
+            tasks = []
+            for url in urls:
+                lock = domain_locks.setdefault(self._get_domain(url), asyncio.Lock())
+                tasks.append(self._fetch_html_async(client, url, lock))
+            await asyncio.gather(*tasks)
+
+    async def _apply_rate_limit_async(self, url):
+        """Async mirror of _apply_rate_limit; caller holds the domain lock."""
+        domain = self._get_domain(url)
+
+        if domain in self.last_request_time:
+            elapsed = time.time() - self.last_request_time[domain]
+            min_delay = self.delay_range[0]
+
+            if elapsed < min_delay:
+                sleep_time = min_delay - elapsed
+                logger.debug(f"Rate limiting: waiting {sleep_time:.2f}s before request to {domain}")
+                await asyncio.sleep(sleep_time)
+                await asyncio.sleep(random.uniform(self.delay_range[0], self.delay_range[1]))
+
+        self.last_request_time[domain] = time.time()
+
+    async def _fetch_html_async(self, client, url, domain_lock):
+        """
+        Async counterpart of _fetch_html with the same retry ladder.
+
+        Args:
+            client: Shared httpx.AsyncClient
+            url: URL to fetch
+            domain_lock: asyncio.Lock serializing requests to this domain
+        """
+        for attempt in range(self.max_retries):
+            try:
+                if attempt == 0:
+                    async with domain_lock:
+                        await self._apply_rate_limit_async(url)
+
+                response = await client.get(url)
+
+                if response.status_code == 200:
+                    self.pages[url] = response.content
+                    self.response_headers[url] = dict(response.headers)
+                    # Fresh bytes invalidate soups parsed from the
+                    # previous fetch - without this a refetch keeps
+                    # serving stale parse trees from _soup_cache
+                    self.clear_soup(url)
+                    logger.info(f"HTML fetched for URL: {url}")
+                    return
+
+                elif response.status_code == 429:
+                    retry_after = response.headers.get('Retry-After')
+                    wait_time = int(retry_after) if retry_after else 5 * (2 ** attempt)
+                    logger.debug(f"Rate limited (429). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
+                    await asyncio.sleep(wait_time)
+
+                elif response.status_code in [503, 502, 504]:
+                    wait_time = 2 * (2 ** attempt)
+                    logger.debug(f"Server error ({response.status_code}). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
+                    await asyncio.sleep(wait_time)
+
+                else:
+                    logger.debug(f"Failed to fetch URL (status {response.status_code}): {url}")
+                    self.pages[url] = None
+                    return
+
+            except httpx.TimeoutException:
+                logger.debug(f"Timeout error for {url}. Attempt {attempt + 1}/{self.max_retries}")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(2 * (attempt + 1))
+
+            except httpx.TransportError as e:
+                logger.debug(f"Connection error for {url}: {e}. Attempt {attempt + 1}/{self.max_retries}")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(3 * (attempt + 1))
+
+            except Exception as e:
+                logger.debug(f"Unexpected error fetching {url}: {e}")
+                self.pages[url] = None
+                return
+
+        logger.debug(f"Failed to fetch {url} after {self.max_retries} attempts")
+        self.pages[url] = None
     
     def fetch_url(self, url):
         """
@@ -111,7 +309,7 @@ class PageFetcher:
         if url in self.pages:
             self._fetch_html(url)
         else:
-            print(f"URL not in pages list: {url}")
+            logger.debug(f"URL not in pages list: {url}")
     
     def _fetch_html(self, url):
         """
@@ -130,10 +328,18 @@ class PageFetcher:
                 response = self.session.get(url, timeout=30)
                 
                 if response.status_code == 200:
-                    self.pages[url] = response.text
-                    print(f"HTML fetched for URL: {url}")
+                    # Store raw bytes: bs4/lxml sniff the charset from the
+                    # document itself, so decoding to str here would just
+                    # be a second decode pass
+                    self.pages[url] = response.content
+                    self.response_headers[url] = dict(response.headers)
+                    # Fresh bytes invalidate soups parsed from the
+                    # previous fetch - without this a refetch keeps
+                    # serving stale parse trees from _soup_cache
+                    self.clear_soup(url)
+                    logger.info(f"HTML fetched for URL: {url}")
                     return
-                
+
                 elif response.status_code == 429:
                     # Handle rate limit error
                     retry_after = response.headers.get('Retry-After')
@@ -143,54 +349,79 @@ class PageFetcher:
                         # Exponential backoff: 5, 10, 20 seconds
                         wait_time = 5 * (2 ** attempt)
                     
-                    print(f"Rate limited (429). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
+                    logger.debug(f"Rate limited (429). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
                     time.sleep(wait_time)
                     
                 elif response.status_code in [503, 502, 504]:  # Server errors
                     wait_time = 2 * (2 ** attempt)  # 2, 4, 8 seconds
-                    print(f"Server error ({response.status_code}). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
+                    logger.debug(f"Server error ({response.status_code}). Waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}")
                     time.sleep(wait_time)
                     
                 else:
-                    print(f"Failed to fetch URL (status {response.status_code}): {url}")
+                    logger.debug(f"Failed to fetch URL (status {response.status_code}): {url}")
                     self.pages[url] = None
                     return
                     
             except requests.exceptions.Timeout:
-                print(f"Timeout error for {url}. Attempt {attempt + 1}/{self.max_retries}")
+                logger.debug(f"Timeout error for {url}. Attempt {attempt + 1}/{self.max_retries}")
                 if attempt < self.max_retries - 1:
                     time.sleep(2 * (attempt + 1))
                     
             except requests.exceptions.ConnectionError as e:
-                print(f"Connection error for {url}: {e}. Attempt {attempt + 1}/{self.max_retries}")
+                logger.debug(f"Connection error for {url}: {e}. Attempt {attempt + 1}/{self.max_retries}")
                 if attempt < self.max_retries - 1:
                     time.sleep(3 * (attempt + 1))
                     
             except Exception as e:
-                print(f"Unexpected error fetching {url}: {e}")
+                logger.debug(f"Unexpected error fetching {url}: {e}")
                 self.pages[url] = None
                 return
         
         # If all retries failed
-        print(f"Failed to fetch {url} after {self.max_retries} attempts")
+        logger.debug(f"Failed to fetch {url} after {self.max_retries} attempts")
         self.pages[url] = None
     
     def get_html(self, url):
         """
         Get the raw HTML content for a specific URL.
-        
+
         Args:
             url: URL to get HTML for
-            
+
         Returns:
-            str: HTML content or None if not available
+            bytes: Raw HTML content or None if not available (including
+            pages whose bytes were already released after parsing)
         """
         if url in self.pages:
-            return self.pages[url]
+            html = self.pages[url]
+            return None if html is True else html
         else:
-            print(f"URL not found: {url}")
+            logger.debug(f"URL not found: {url}")
             return None
     
+    def _release_html(self, url):
+        """
+        Replace stored HTML bytes with a fetched-ok sentinel.
+
+        Called after a successful parse so large pages don't stay
+        resident for the life of the fetcher. No-op when keep_html is
+        set. The cached soup remains the source of truth for the page.
+        """
+        if not self.keep_html and self.pages.get(url) not in (None, True):
+            self.pages[url] = True
+
+    def get_etag(self, url):
+        """
+        Get the ETag header from the last successful fetch of a URL.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            str: ETag value or None if not available
+        """
+        return self.response_headers.get(url, {}).get('ETag')
+
     def get_soup(self, url):
         """
         Get a BeautifulSoup object for a specific URL.
@@ -201,12 +432,141 @@ class PageFetcher:
         Returns:
             BeautifulSoup: Parsed HTML or None if not available
         """
+        cache_key = (url, False)
+        if cache_key in self._soup_cache:
+            return self._soup_cache[cache_key]
+
         html_content = self.get_html(url)
         if html_content:
-            return BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, BS_PARSER)
+            self._soup_cache[cache_key] = soup
+            self._release_html(url)
+            return soup
         else:
             return None
     
+    def get_strained_soup(self, url):
+        """
+        Get a BeautifulSoup object restricted to scraper-relevant tags.
+
+        Uses a SoupStrainer so subtrees the HierarchicalScraper never
+        reads (divs, spans, scripts, styles...) are skipped at parse
+        time, which is much cheaper on large pages.
+
+        Args:
+            url: URL to parse
+
+        Returns:
+            BeautifulSoup: Parsed relevant elements or None if not available
+        """
+        cache_key = (url, True)
+        if cache_key in self._soup_cache:
+            return self._soup_cache[cache_key]
+
+        html_content = self.get_html(url)
+        if html_content:
+            soup = BeautifulSoup(html_content, BS_PARSER, parse_only=RELEVANT_TAGS)
+            self._soup_cache[cache_key] = soup
+            self._release_html(url)
+            return soup
+        else:
+            return None
+
+    @staticmethod
+    def _split_at_head(html):
+        """
+        Split a document at the </head> boundary with a cheap find.
+
+        Returns:
+            tuple: (head region, body region). Malformed pages without a
+            </head> yield the whole document for both regions.
+        """
+        marker = b'</head>' if isinstance(html, bytes) else '</head>'
+        split = html.find(marker)
+        if split == -1:
+            return html, html
+        return html[:split], html[split:]
+
+    def get_body_soup(self, url):
+        """
+        Get a BeautifulSoup of just the body region's scraper tags.
+
+        The document is split at </head> and only the body side is
+        parsed (with the BODY_TAGS strainer, unless a footer-classed
+        container forces a full parse); pair with get_metadata, which
+        parses only the head side.
+
+        Args:
+            url: URL to parse
+
+        Returns:
+            BeautifulSoup: Parsed body elements or None if not available
+        """
+        cache_key = (url, 'body')
+        if cache_key in self._soup_cache:
+            return self._soup_cache[cache_key]
+
+        html_content = self.get_html(url)
+        if not html_content:
+            return None
+
+        _, body_html = self._split_at_head(html_content)
+        footer_re = (_FOOTER_CLASSED_RE if isinstance(body_html, bytes)
+                     else _FOOTER_CLASSED_RE_STR)
+        if footer_re.search(body_html):
+            # A footer-classed container must stay in the tree so the
+            # scraper can recognise its children as footer content
+            soup = BeautifulSoup(body_html, BS_PARSER)
+        else:
+            soup = BeautifulSoup(body_html, BS_PARSER, parse_only=BODY_TAGS)
+        self._soup_cache[cache_key] = soup
+
+        # Safe to drop the raw bytes only once the head region has also
+        # been consumed (get_metadata caches its result)
+        if (url, 'head') in self._soup_cache:
+            self._release_html(url)
+        return soup
+
+    def get_metadata(self, url):
+        """
+        Get just the title and meta description for a URL.
+
+        Parses only <title> and <meta> tags, so even multi-MB documents
+        cost next to nothing when only metadata is needed (e.g. URL
+        listings). Result is cached per URL.
+
+        Args:
+            url: URL to inspect
+
+        Returns:
+            dict: {'title': ..., 'meta_description': ...} or None if the
+            page isn't available
+        """
+        cache_key = (url, 'head')
+        if cache_key in self._soup_cache:
+            return self._soup_cache[cache_key]
+
+        html_content = self.get_html(url)
+        if not html_content:
+            return None
+
+        # Only the head region can contain title/meta; don't even hand
+        # the body bytes to the parser
+        head_html, _ = self._split_at_head(html_content)
+        soup = BeautifulSoup(head_html, BS_PARSER, parse_only=HEAD_TAGS)
+
+        title_tag = soup.find('title')
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if not meta_desc:
+            meta_desc = soup.find('meta', attrs={'property': 'og:description'})
+
+        metadata = {
+            'title': title_tag.get_text(strip=True) if title_tag else None,
+            'meta_description': meta_desc.get('content', '').strip() if meta_desc else None
+        }
+        self._soup_cache[cache_key] = metadata
+        return metadata
+
     def get_all_urls(self):
         """
         Get a list of all URLs managed by this fetcher.
@@ -234,7 +594,20 @@ class PageFetcher:
         """
         if url in self.pages:
             self.pages[url] = None
-            print(f"HTML cleared for URL: {url}")
+            self.clear_soup(url)
+            logger.debug(f"HTML cleared for URL: {url}")
+
+    def clear_soup(self, url):
+        """
+        Drop any cached parse trees for a specific URL.
+
+        Args:
+            url: URL to clear
+        """
+        self._soup_cache.pop((url, False), None)
+        self._soup_cache.pop((url, True), None)
+        self._soup_cache.pop((url, 'head'), None)
+        self._soup_cache.pop((url, 'body'), None)
     
     def remove_url(self, url):
         """
@@ -245,9 +618,11 @@ class PageFetcher:
         """
         if url in self.pages:
             del self.pages[url]
-            print(f"URL removed: {url}")
+            self.clear_soup(url)
+            self.response_headers.pop(url, None)
+            logger.debug(f"URL removed: {url}")
         else:
-            print(f"URL not found: {url}")
+            logger.debug(f"URL not found: {url}")
     
     def close(self):
         """Close the session when done."""
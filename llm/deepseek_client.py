@@ -1,8 +1,89 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+from pathlib import Path
 from typing import Dict, List, Optional, Union
+import asyncio
+import hashlib
+import httpx
+import random
 import time
 import json
 
+# orjson parses/serialises JSON several times faster than the stdlib;
+# fall back to stdlib json where it isn't installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_sorted(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_sorted(obj) -> str:
+        return json.dumps(obj, sort_keys=True)
+
+
+_JSON_INSTRUCTION = "\n\nIMPORTANT: Return ONLY valid JSON with no additional text."
+
+
+def _with_json_instruction(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Append the JSON instruction on a shallow copy of the messages
+
+    Mutating the caller's list in place made the suffix accumulate when
+    the same messages were reused across calls (and would desync any
+    cache key computed beforehand).
+    """
+    if messages[0]['role'] == 'system':
+        head = dict(messages[0], content=messages[0]['content'] + _JSON_INSTRUCTION)
+        return [head, *messages[1:]]
+    return messages
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """
+    Find the first balanced top-level JSON value in text
+
+    Single linear scan tracking brace/bracket depth and string/escape
+    state - unlike the old greedy regex, this can't backtrack on large
+    malformed responses.
+
+    Returns:
+        The candidate JSON substring, or None if nothing balanced
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+
+    for i, ch in enumerate(text):
+        if start == -1:
+            if ch in '{[':
+                start = i
+                depth = 1
+            continue
+
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[':
+            depth += 1
+        elif ch in '}]':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
 
 class DeepSeekClient:
     """Generic client for DeepSeek LLM API"""
@@ -12,47 +93,209 @@ class DeepSeekClient:
         api_key: str, 
         model: str = "deepseek-chat",
         max_retries: int = 2,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        cache_dir: Optional[str] = None,
+        fast_model: Optional[str] = None
     ):
         """
         Initialize DeepSeek client
-        
+
         Args:
             api_key: DeepSeek API key
             model: Model to use (default: deepseek-reasoner)
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            cache_dir: Directory for persisting cached responses across
+                runs; None keeps the cache in-memory only
+            fast_model: Cheaper model tried first by the cascade
+                methods, escalating to `model` when its answer fails
+                validation
         """
         self.model = model
+        self.fast_model = fast_model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+
+        # Response cache keyed by prompt hash - identical prompts recur
+        # during iterative sessions, so repeat calls skip the API entirely
+        self._response_cache = {}
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Explicit httpx clients with deep keep-alive pools, so batched
+        # calls reuse warm TLS connections instead of paying handshake
+        # cost per request
+        self._api_key = api_key
+        self._limits = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
         # Initialize OpenAI client with DeepSeek configuration
         self.client = OpenAI(
             api_key=api_key,
-            base_url="https://api.deepseek.com"
+            base_url="https://api.deepseek.com",
+            http_client=httpx.Client(limits=self._limits, timeout=httpx.Timeout(60))
         )
+
+        # Async clients are created lazily, one per event loop - see the
+        # async_client property
+        self._async_clients = {}
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Async client bound to the running event loop, created lazily
+
+        The sync entry points (GapAnalyser.analyze, complete_batch) call
+        asyncio.run, which builds and closes a fresh loop per call, while
+        this client object lives for the whole process. Keep-alive
+        connections are tied to the loop they were opened on, so a single
+        shared AsyncOpenAI would hand a later run pooled connections from
+        a dead loop and fail with 'Event loop is closed'. One client per
+        loop keeps connection reuse within a run without ever reusing a
+        connection across loops.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Drop clients whose loops have closed - their pooled
+            # connections died with the loop
+            for stale in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[stale]
+            client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url="https://api.deepseek.com",
+                http_client=httpx.AsyncClient(limits=self._limits,
+                                              timeout=httpx.Timeout(60))
+            )
+            self._async_clients[loop] = client
+        return client
     
+    @staticmethod
+    def _retry_after_seconds(error) -> Optional[float]:
+        """Retry-After value from an API error's response, if any"""
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers:
+            value = headers.get('retry-after')
+            if value:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+        return None
+
+    def _backoff_delay(self, attempt: int, error=None) -> float:
+        """
+        Backoff delay for a retry attempt
+
+        Exponential in the attempt number (capped at 30s), raised to the
+        server's Retry-After when one is present, plus up to a second of
+        jitter so concurrent retries don't stampede in lockstep.
+        """
+        delay = min(self.retry_delay * (2 ** attempt), 30)
+        retry_after = self._retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay + random.uniform(0, 1)
+
+    @staticmethod
+    def _is_retryable(error_msg: str) -> bool:
+        """
+        Decide whether an API error is worth retrying
+
+        Rate limits (429) and server errors (5xx) are transient - exactly
+        the failures concurrency provokes - while auth and bad-request
+        errors will fail identically on every attempt.
+        """
+        if any(code in error_msg for code in ('401', '400', '403', '404')):
+            return False
+        return True
+
+    @staticmethod
+    def _normalize_for_cache(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Collapse whitespace in message contents before hashing
+
+        Prompts are assembled from templates, so runs that differ only in
+        incidental indentation or blank lines still hit the same cache
+        entry - a cheap approximation of near-match caching.
+        """
+        return [
+            {'role': m['role'], 'content': ' '.join(m['content'].split())}
+            for m in messages
+        ]
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        model: Optional[str] = None
+    ) -> str:
+        """Build a deterministic cache key for a request"""
+        normalized = self._normalize_for_cache(messages)
+        payload = f"{model or self.model}|{temperature}|{_json_dumps_sorted(normalized)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str):
+        """
+        Look up a cached response, falling back to the disk store
+
+        Disk hits are promoted into the in-memory dict so each entry is
+        read from disk at most once per process.
+        """
+        if key in self._response_cache:
+            return self._response_cache[key]
+
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        value = json.load(f)['value']
+                except (ValueError, KeyError, OSError):
+                    return None
+                self._response_cache[key] = value
+                return value
+
+        return None
+
+    def _cache_put(self, key: str, value):
+        """Store a response in memory and, when configured, on disk"""
+        self._response_cache[key] = value
+        if self.cache_dir:
+            try:
+                with open(self.cache_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+                    json.dump({'value': value}, f, ensure_ascii=False)
+            except OSError as e:
+                print(f"Warning: could not write response cache entry: {e}")
+
     def complete(
-        self, 
-        messages: List[Dict[str, str]], 
+        self,
+        messages: List[Dict[str, str]],
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache: bool = False
     ) -> str:
         """
         Get completion from DeepSeek
-        
+
         Args:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
-            
+            cache: Reuse cached response for an identical prompt
+
         Returns:
             Response content as string
-            
+
         Raises:
             Exception: If API call fails after retries
         """
+        if cache:
+            key = self._cache_key(messages, temperature)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
         for attempt in range(self.max_retries + 1):
             try:
                 response = self.client.chat.completions.create(
@@ -61,53 +304,284 @@ class DeepSeekClient:
                     temperature=temperature,
                     max_tokens=max_tokens
                 )
-                
-                return response.choices[0].message.content
-                
+
+                content = response.choices[0].message.content
+                if cache:
+                    self._cache_put(key, content)
+                return content
+
             except Exception as e:
                 error_msg = str(e)
-                
-                # Handle specific errors
-                if "401" in error_msg:
-                    raise Exception("Authentication failed: Check your API key")
-                elif "429" in error_msg:
-                    raise Exception(f"Rate limit exceeded: {error_msg}")
-                elif "400" in error_msg:
+
+                # Terminal errors - retrying would fail identically
+                if not self._is_retryable(error_msg):
+                    if "401" in error_msg:
+                        raise Exception("Authentication failed: Check your API key")
                     raise Exception(f"Bad request: {error_msg}")
-                
-                # Retry for other errors
+
+                # Retry transient errors (429/5xx/network) with backoff
                 if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (attempt + 1)
+                    wait_time = self._backoff_delay(attempt, e)
                     print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {error_msg}")
-                    print(f"Retrying in {wait_time} seconds...")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     raise Exception(f"API request failed after {self.max_retries+1} attempts: {error_msg}")
     
-    def complete_json(
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache: bool = False
+    ) -> str:
+        """
+        Async version of complete for concurrent requests
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            cache: Reuse cached response for an identical prompt
+
+        Returns:
+            Response content as string
+
+        Raises:
+            Exception: If API call fails after retries
+        """
+        if cache:
+            key = self._cache_key(messages, temperature)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+
+                content = response.choices[0].message.content
+                if cache:
+                    self._cache_put(key, content)
+                return content
+
+            except Exception as e:
+                error_msg = str(e)
+
+                if not self._is_retryable(error_msg):
+                    if "401" in error_msg:
+                        raise Exception("Authentication failed: Check your API key")
+                    raise Exception(f"Bad request: {error_msg}")
+
+                if attempt < self.max_retries:
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {error_msg}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise Exception(f"API request failed after {self.max_retries+1} attempts: {error_msg}")
+
+    async def complete_batch_async(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        concurrency: int = 32,
+        cache: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Run many completions concurrently with a concurrency cap
+
+        Total latency collapses from the sum of the individual calls to
+        roughly the slowest one. Failures come back in-place as
+        exceptions rather than aborting the whole batch.
+
+        Args:
+            messages_list: One messages list per completion
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens per response
+            concurrency: Maximum simultaneous in-flight requests
+            cache: Reuse cached responses for identical prompts
+
+        Returns:
+            One response string (or Exception) per input, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(messages):
+            async with semaphore:
+                return await self.acomplete(
+                    messages, temperature=temperature,
+                    max_tokens=max_tokens, cache=cache
+                )
+
+        return await asyncio.gather(
+            *(run_one(messages) for messages in messages_list),
+            return_exceptions=True
+        )
+
+    def complete_batch(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        concurrency: int = 32,
+        cache: bool = False
+    ) -> List[Union[str, Exception]]:
+        """Sync wrapper around complete_batch_async for non-async callers"""
+        return asyncio.run(self.complete_batch_async(
+            messages_list, temperature=temperature, max_tokens=max_tokens,
+            concurrency=concurrency, cache=cache
+        ))
+
+    def complete_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ):
+        """
+        Stream a completion from DeepSeek, yielding text deltas
+
+        Lets callers start consuming (parsing, displaying) output while
+        the model is still generating instead of waiting for the full
+        response.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Response text fragments as they arrive
+
+        Raises:
+            Exception: If API call fails after retries
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+
+                for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        yield delta
+                return
+
+            except Exception as e:
+                error_msg = str(e)
+
+                if not self._is_retryable(error_msg):
+                    if "401" in error_msg:
+                        raise Exception("Authentication failed: Check your API key")
+                    raise Exception(f"Bad request: {error_msg}")
+
+                if attempt < self.max_retries:
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {error_msg}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+                else:
+                    raise Exception(f"API request failed after {self.max_retries+1} attempts: {error_msg}")
+
+    async def acomplete_stream(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 4096
+    ):
+        """
+        Async version of complete_stream, yielding text deltas
+
+        Callers see first-token latency instead of total completion
+        time, e.g. for live progress display while other requests are
+        in flight.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Response text fragments as they arrive
+
+        Raises:
+            Exception: If API call fails after retries
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                stream = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        yield delta
+                return
+
+            except Exception as e:
+                error_msg = str(e)
+
+                if not self._is_retryable(error_msg):
+                    if "401" in error_msg:
+                        raise Exception("Authentication failed: Check your API key")
+                    raise Exception(f"Bad request: {error_msg}")
+
+                if attempt < self.max_retries:
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {error_msg}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise Exception(f"API request failed after {self.max_retries+1} attempts: {error_msg}")
+
+    def complete_json(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache: bool = False
     ) -> Union[Dict, List]:
         """
         Get JSON completion from DeepSeek
-        
+
         Args:
             messages: List of message dicts
             temperature: Sampling temperature
             max_tokens: Maximum tokens
-            
+            cache: Reuse cached response for an identical prompt
+
         Returns:
             Parsed JSON response (dict or list)
-            
+
         Raises:
             Exception: If API call fails or response isn't valid JSON
         """
-        # Add JSON instruction to system message if not present
-        if messages[0]['role'] == 'system':
-            messages[0]['content'] += "\n\nIMPORTANT: Return ONLY valid JSON with no additional text."
-        
+        if cache:
+            key = self._cache_key(messages, temperature)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        # Add JSON instruction to system message (copy, don't mutate)
+        messages = _with_json_instruction(messages)
+
         for attempt in range(self.max_retries + 1):
             try:
                 response = self.client.chat.completions.create(
@@ -122,27 +596,235 @@ class DeepSeekClient:
                 
                 # Parse JSON
                 try:
-                    return json.loads(content)
-                except json.JSONDecodeError as e:
+                    parsed = _json_loads(content)
+                except ValueError as e:
                     # Try to extract JSON from the response
-                    import re
-                    
-                    # Look for JSON array or object
-                    json_match = re.search(r'(\[[\s\S]*\]|\{[\s\S]*\})', content)
-                    if json_match:
-                        return json.loads(json_match.group(1))
+                    candidate = _extract_json(content)
+                    if candidate:
+                        parsed = _json_loads(candidate)
                     else:
                         raise Exception(f"Invalid JSON in response: {str(e)}")
-                
+
+                if cache:
+                    self._cache_put(key, parsed)
+                return parsed
+
             except Exception as e:
-                if attempt < self.max_retries:
-                    wait_time = self.retry_delay * (attempt + 1)
+                if attempt < self.max_retries and self._is_retryable(str(e)):
+                    wait_time = self._backoff_delay(attempt, e)
                     print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {str(e)}")
-                    print(f"Retrying in {wait_time} seconds...")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     raise
     
+    async def acomplete_json(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache: bool = False,
+        model: Optional[str] = None
+    ) -> Union[Dict, List]:
+        """
+        Async version of complete_json for concurrent requests
+
+        Args:
+            messages: List of message dicts
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            cache: Reuse cached response for an identical prompt
+            model: Override the client's default model for this call
+
+        Returns:
+            Parsed JSON response (dict or list)
+
+        Raises:
+            Exception: If API call fails or response isn't valid JSON
+        """
+        if cache:
+            key = self._cache_key(messages, temperature, model)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        # Add JSON instruction to system message (copy, don't mutate)
+        messages = _with_json_instruction(messages)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=model or self.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+
+                content = response.choices[0].message.content
+
+                # Parse JSON
+                try:
+                    parsed = _json_loads(content)
+                except ValueError as e:
+                    # Try to extract JSON from the response
+                    candidate = _extract_json(content)
+                    if candidate:
+                        parsed = _json_loads(candidate)
+                    else:
+                        raise Exception(f"Invalid JSON in response: {str(e)}")
+
+                if cache:
+                    self._cache_put(key, parsed)
+                return parsed
+
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable(str(e)):
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {str(e)}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise
+
+    def complete_structured(
+        self,
+        messages: List[Dict[str, str]],
+        schema: Dict,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> Union[Dict, List]:
+        """
+        JSON completion with a server-enforced response schema
+
+        Passing a JSON schema makes the API guarantee schema-valid JSON,
+        so the prose-recovery fallback in complete_json never runs.
+
+        Args:
+            messages: List of message dicts
+            schema: JSON schema dict the response must satisfy
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+
+        Returns:
+            Parsed JSON response matching the schema
+        """
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": "result", "schema": schema, "strict": True}
+        }
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format=response_format,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                return _json_loads(response.choices[0].message.content)
+
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable(str(e)):
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {str(e)}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+                else:
+                    raise
+
+    async def acomplete_structured(
+        self,
+        messages: List[Dict[str, str]],
+        schema: Dict,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> Union[Dict, List]:
+        """Async version of complete_structured"""
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": "result", "schema": schema, "strict": True}
+        }
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format=response_format,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                return _json_loads(response.choices[0].message.content)
+
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable(str(e)):
+                    wait_time = self._backoff_delay(attempt, e)
+                    print(f"API error (attempt {attempt+1}/{self.max_retries+1}): {str(e)}")
+                    print(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise
+
+    async def acomplete_json_cascade(
+        self,
+        messages: List[Dict[str, str]],
+        validate=None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache: bool = False
+    ) -> Union[Dict, List]:
+        """
+        JSON completion via the cheap model, escalating when it fails
+
+        When a fast_model is configured it answers first; only responses
+        that error out or fail the caller's validation are re-issued to
+        the stronger default model. Most items are easy, so the cascade
+        cuts latency and cost without losing accuracy on the hard ones.
+
+        Args:
+            messages: List of message dicts
+            validate: Optional callable(result) -> bool; False escalates
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            cache: Reuse cached responses for identical prompts
+
+        Returns:
+            Parsed JSON response (dict or list)
+        """
+        if self.fast_model:
+            try:
+                result = await self.acomplete_json(
+                    messages, temperature=temperature, max_tokens=max_tokens,
+                    cache=cache, model=self.fast_model
+                )
+                if validate is None or validate(result):
+                    return result
+                print(f"Fast model response failed validation, escalating to {self.model}")
+            except Exception as e:
+                print(f"Fast model failed ({e}), escalating to {self.model}")
+
+        return await self.acomplete_json(
+            messages, temperature=temperature, max_tokens=max_tokens, cache=cache
+        )
+
+    def close(self):
+        """Close the sync connection pool when done"""
+        self.client.close()
+
+    async def aclose(self):
+        """Close the current loop's async connection pool when done"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def simple_prompt(self, prompt: str, system_message: str = None) -> str:
         """
         Convenience method for simple prompts
@@ -6,14 +6,38 @@ Can run full analysis or use saved intermediate results
 
 import json
 import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
 
+# The 11 possible score bars, precomputed (scores are multiples of 25)
+SCORE_BARS = ["█" * i + "░" * (10 - i) for i in range(11)]
+
+# orjson reads/writes the large intermediate JSON files several times
+# faster than the stdlib; fall back transparently when absent
+try:
+    import orjson
+
+    def _json_load_file(f):
+        return orjson.loads(f.read())
+
+    def _json_dump_bytes(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_load_file(f):
+        return json.load(f)
+
+    def _json_dump_bytes(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 from config import DEEPSEEK_API_KEY
 from models.data_models import KeywordData, DimensionHierarchy, ExtractedContent, GapAnalysisResult
 from extractors.aio_extractor import AIOExtractor
 from extractors.content_extractor import ContentExtractor
-from analysers.dimension_synthesiser import DimensionSynthesizer
+from analysers.dimension_synthesiser import DimensionSynthesiser
 from analysers.gap_analyser import GapAnalyser
 from llm.deepseek_client import DeepSeekClient
 
@@ -28,7 +52,7 @@ class ContentGapAnalyser:
         # Initialize components
         self.aio_extractor = AIOExtractor()
         self.content_extractor = ContentExtractor()
-        self.synthesizer = DimensionSynthesizer(self.llm_client)
+        self.synthesizer = DimensionSynthesiser(self.llm_client)
         self.analyzer = GapAnalyser(self.llm_client)
         
         # Ensure output directory exists
@@ -75,22 +99,26 @@ class ContentGapAnalyser:
                 ]
             })
         
-        # Step 2: Synthesize dimension hierarchy
-        print("\nStep 2: Synthesizing dimension hierarchy...")
-        hierarchy = self.synthesizer.synthesize(key_word, keywords_data)
-        
+        # Steps 2 and 3 are independent - hierarchy synthesis is an LLM
+        # round-trip and content extraction a fetch + parse - so they run
+        # concurrently and the total wait is the slower of the two
+        print("\nSteps 2+3: Synthesizing dimension hierarchy and extracting target content...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hierarchy_future = executor.submit(
+                self.synthesizer.synthesize, key_word, keywords_data
+            )
+            content_future = executor.submit(
+                self.content_extractor.extract_from_url, target_url
+            )
+            hierarchy = hierarchy_future.result()
+            content = content_future.result()
+
         if save_intermediate:
             self._save_intermediate("dimension_hierarchy.json", {
                 "key_word": hierarchy.key_word,
                 "hierarchy_text": hierarchy.hierarchy_text,
                 "structured": hierarchy.structured
             })
-        
-        # Step 3: Extract content from target URL
-        print("\nStep 3: Extracting content from target URL...")
-        content = self.content_extractor.extract_from_url(target_url)
-        
-        if save_intermediate:
             self._save_intermediate("extracted_content.json", {
                 "url": content.url,
                 "title": content.title,
@@ -134,8 +162,8 @@ class ContentGapAnalyser:
         
         # Load saved hierarchy
         print(f"Loading hierarchy from: {hierarchy_file}")
-        with open(hierarchy_file, 'r') as f:
-            hierarchy_data = json.load(f)
+        with open(hierarchy_file, 'rb') as f:
+            hierarchy_data = _json_load_file(f)
         
         hierarchy = DimensionHierarchy(
             key_word=hierarchy_data['key_word'],
@@ -145,8 +173,8 @@ class ContentGapAnalyser:
         
         # Load saved content
         print(f"Loading content from: {content_file}")
-        with open(content_file, 'r') as f:
-            content_data = json.load(f)
+        with open(content_file, 'rb') as f:
+            content_data = _json_load_file(f)
         
         content = ExtractedContent(
             url=content_data['url'],
@@ -171,71 +199,99 @@ class ContentGapAnalyser:
         
         return results
     
-    def _load_keywords_from_csv(self, csv_file: str) -> list:
-        """Load keywords and AIO HTML from CSV"""
+    def _load_keywords_from_csv(self, csv_file: str, keep_html: bool = False) -> list:
+        """
+        Load keywords and AIO HTML from CSV
+
+        Args:
+            csv_file: Path to the keywords CSV
+            keep_html: Retain raw AIO HTML on each KeywordData. Off by
+                default - once dimensions are extracted the HTML (often
+                hundreds of KB per keyword) is no longer needed, and
+                dropping it keeps peak memory flat for large files
+        """
         import csv
-        
-        keywords_data = []
-        
+
         with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Extract dimensions from AIO HTML
-                dimensions = self.aio_extractor.extract_dimensions(row['aio_html'])
-                
-                kw_data = KeywordData(
-                    keyword=row['keyword'],
-                    aio_html=row['aio_html'],
-                    raw_dimensions=dimensions
-                )
-                
-                keywords_data.append(kw_data)
-                print(f"  - Loaded '{row['keyword']}' with {len(dimensions)} dimensions")
-        
+            rows = [(row['keyword'], row['aio_html']) for row in csv.DictReader(f)]
+
+        # Dimension extraction is CPU-bound HTML parsing and independent
+        # per row, so fan it out across processes (bypassing the GIL);
+        # single-row files skip the pool overhead
+        htmls = [aio_html for _, aio_html in rows]
+        if len(rows) > 1:
+            with ProcessPoolExecutor() as executor:
+                all_dimensions = list(executor.map(
+                    self.aio_extractor.extract_dimensions, htmls, chunksize=8
+                ))
+        else:
+            all_dimensions = [self.aio_extractor.extract_dimensions(h) for h in htmls]
+
+        keywords_data = []
+        for (keyword, aio_html), dimensions in zip(rows, all_dimensions):
+            keywords_data.append(KeywordData(
+                keyword=keyword,
+                aio_html=aio_html if keep_html else "",
+                raw_dimensions=dimensions
+            ))
+            print(f"  - Loaded '{keyword}' with {len(dimensions)} dimensions")
+
         return keywords_data
     
+    @staticmethod
+    def _atomic_write_json(filepath: Path, data: dict):
+        """
+        Write JSON to a file in one syscall via an atomic rename
+
+        Serializing first and renaming a sibling tempfile means a crash
+        mid-write can't leave a truncated checkpoint behind - reruns can
+        always trust what's on disk.
+        """
+        tmp_path = filepath.with_suffix('.json.tmp')
+        tmp_path.write_bytes(_json_dump_bytes(data))
+        os.replace(tmp_path, filepath)
+
     def _save_intermediate(self, filename: str, data: dict):
         """Save intermediate results"""
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._atomic_write_json(filepath, data)
         print(f"  → Saved to {filepath}")
-    
+
     def _save_results(self, results: dict):
         """Save final analysis results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"gap_analysis_{timestamp}.json"
         filepath = self.output_dir / filename
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        
+
+        self._atomic_write_json(filepath, results)
+
         print(f"\n✓ Analysis saved to: {filepath}")
     
     def _display_summary(self, analysis: GapAnalysisResult):
         """Display analysis summary"""
-        print("\n" + "="*60)
-        print("ANALYSIS SUMMARY")
-        print("="*60)
-        
-        print(f"\nOverall Score: {analysis.overall_score}/100")
-        
-        print(f"\nStrengths ({len(analysis.strengths)}):")
-        for s in analysis.strengths:
-            print(f"  ✓ {s}")
-        
-        print(f"\nWeaknesses ({len(analysis.weaknesses)}):")
-        for w in analysis.weaknesses:
-            print(f"  ✗ {w}")
-        
-        print(f"\nRecommendations ({len(analysis.recommendations)}):")
-        for i, r in enumerate(analysis.recommendations, 1):
-            print(f"  {i}. {r}")
-        
-        print("\nDimension Scores:")
-        for ds in sorted(analysis.dimension_scores, key=lambda x: x.score):
-            bar = "█" * (ds.score // 10) + "░" * (10 - ds.score // 10)
-            print(f"  {ds.dimension_path:<40} [{bar}] {ds.score}/100")
+        # Build the whole summary in memory and emit it with one write -
+        # one flush instead of a print per dimension
+        lines = [
+            "\n" + "="*60,
+            "ANALYSIS SUMMARY",
+            "="*60,
+            f"\nOverall Score: {analysis.overall_score}/100",
+            f"\nStrengths ({len(analysis.strengths)}):"
+        ]
+        lines.extend(f"  ✓ {s}" for s in analysis.strengths)
+
+        lines.append(f"\nWeaknesses ({len(analysis.weaknesses)}):")
+        lines.extend(f"  ✗ {w}" for w in analysis.weaknesses)
+
+        lines.append(f"\nRecommendations ({len(analysis.recommendations)}):")
+        lines.extend(f"  {i}. {r}" for i, r in enumerate(analysis.recommendations, 1))
+
+        lines.append("\nDimension Scores:")
+        for ds in sorted(analysis.dimension_scores, key=attrgetter('score')):
+            bar = SCORE_BARS[ds.score // 10]
+            lines.append(f"  {ds.dimension_path:<40} [{bar}] {ds.score}/100")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -1,10 +1,19 @@
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Dict, Optional
 from datetime import datetime
 import json
 
+# C-level bulk attribute fetch for serializing score lists
+_score_fields = attrgetter('dimension_path', 'score', 'reasoning', 'child_coverage')
 
-@dataclass
+# All models use slots=True: instances are created per keyword / per
+# dimension and held in lists, and slots drop the per-instance __dict__
+# (cached values live in explicit underscore fields instead of
+# cached_property, which needs a __dict__)
+
+
+@dataclass(slots=True)
 class KeywordData:
     """Represents a keyword with its AIO HTML content"""
     keyword: str
@@ -19,61 +28,115 @@ class KeywordData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionHierarchy:
     """Represents the synthesized dimension hierarchy"""
     key_word: str
     hierarchy_text: str  # Raw indented text from LLM
     structured: Dict = field(default_factory=dict)  # Parsed structure
-    
+    _parent_children_map: Optional[Dict] = field(default=None, repr=False)
+    _parsed: bool = field(default=False, repr=False)
+
     def parse_hierarchy(self):
-        """Parse the indented text into structured format"""
-        lines = self.hierarchy_text.strip().split('\n')
+        """
+        Parse the indented text into structured format
+
+        The synthesis prompt pins the format to exactly 2 spaces per
+        level with '-' bullets, so the level is a closed-form shift of
+        the indent width rather than general indent detection. Lines
+        with odd indentation are malformed and skipped.
+        """
         result = []
-        
-        for line in lines:
-            if line.strip():
-                # Count indentation level
-                indent = len(line) - len(line.lstrip())
-                level = indent // 2  # Assuming 2 spaces per level
-                name = line.strip().lstrip('- ')
-                
-                result.append({
-                    'name': name,
-                    'level': level,
-                    'path': self._build_path(result, name, level)
-                })
-        
+        self._parent_children_map = None  # Invalidate cached map on reparse
+
+        # Last seen path at each level; parent lookup is O(1) instead of
+        # a reverse scan of everything parsed so far
+        path_by_level = {}
+
+        for line in self.hierarchy_text.strip().splitlines():
+            stripped = line.lstrip(' ')
+            if not stripped:
+                continue
+
+            indent = len(line) - len(stripped)
+            if indent & 1:  # Not the 2-spaces-per-level format
+                continue
+            level = indent >> 1
+            name = stripped.lstrip('- ').rstrip()
+            if not name:
+                continue
+
+            parent = path_by_level.get(level - 1) if level else None
+            path = f"{parent} > {name}" if parent else name
+            path_by_level[level] = path
+
+            result.append({
+                'name': name,
+                'level': level,
+                'path': path
+            })
+
         self.structured = result
+        self._parsed = True
         return result
+
+    def ensure_parsed(self):
+        """Parse the hierarchy text once; later calls are a flag check"""
+        if not self._parsed and not self.structured:
+            self.parse_hierarchy()
     
-    def _build_path(self, existing, name, level):
-        """Build the path string for a dimension"""
-        if level == 0:
-            return name
-        
-        # Find parent (last item with level = current_level - 1)
-        parent = None
-        for item in reversed(existing):
-            if item['level'] == level - 1:
-                parent = item
-                break
-        
-        if parent:
-            return f"{parent['path']} > {name}"
-        return name
-
-
-@dataclass
+    def parent_children_map(self) -> Dict[str, List[Dict]]:
+        """
+        Map of parent path -> child items, built once per parsed hierarchy
+
+        The structured list is stable after parse_hierarchy(), so the map
+        is cached and reused across repeated analyses of the same hierarchy.
+        """
+        if self._parent_children_map is None:
+            mapping = {}
+            mapping_setdefault = mapping.setdefault  # Bind once for the loop
+            for item in self.structured:
+                if item['level'] > 0:  # Skip root
+                    path = item['path']
+                    parent_path = path.rsplit(' > ', 1)[0]
+                    if parent_path != path:
+                        mapping_setdefault(parent_path, []).append(item)
+            self._parent_children_map = mapping
+        return self._parent_children_map
+
+
+@dataclass(slots=True)
 class DimensionScore:
     """Score for a single dimension"""
     dimension_path: str
     score: int  # 0, 25, 50, 75, 100
     reasoning: str
     child_coverage: Optional[str] = None
-    
+    _leaf_name: Optional[str] = field(default=None, repr=False, compare=False)
+    _path_parts: Optional[List[str]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def leaf_name(self) -> str:
+        """Last segment of the dimension path, computed once"""
+        if self._leaf_name is None:
+            self._leaf_name = self.dimension_path.rsplit(' > ', 1)[-1]
+        return self._leaf_name
+
+    @property
+    def path_parts(self) -> List[str]:
+        """Segments of the dimension path, split once"""
+        if self._path_parts is None:
+            self._path_parts = self.dimension_path.split(' > ')
+        return self._path_parts
+
+    @property
+    def level(self) -> int:
+        """Depth of this dimension in the hierarchy (1 = top level)"""
+        return len(self.path_parts)
 
-@dataclass
+
+
+@dataclass(slots=True)
 class GapAnalysisResult:
     """Complete gap analysis results"""
     analysis_id: str
@@ -94,13 +157,10 @@ class GapAnalysisResult:
             'key_word': self.key_word,
             'target_url': self.target_url,
             'dimension_scores': [
-                {
-                    'path': ds.dimension_path,
-                    'score': ds.score,
-                    'reasoning': ds.reasoning,
-                    'child_coverage': ds.child_coverage
-                }
-                for ds in self.dimension_scores
+                {'path': path, 'score': score,
+                 'reasoning': reasoning, 'child_coverage': child_coverage}
+                for path, score, reasoning, child_coverage
+                in map(_score_fields, self.dimension_scores)
             ],
             'overall_score': self.overall_score,
             'strengths': self.strengths,
@@ -109,21 +169,51 @@ class GapAnalysisResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedContent:
     """Structured content extracted from a webpage"""
     url: str
     title: str
     meta_description: str
     content_blocks: List[Dict]
-    
+    _all_text: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def _text_parts(self):
+        """Yield every text fragment in document order"""
+        if self.title:
+            yield self.title
+        if self.meta_description:
+            yield self.meta_description
+        for block in self.content_blocks:
+            heading = block.get('heading')
+            if heading:
+                yield heading
+            yield from filter(None, block.get('paragraphs', ()))
+            yield from filter(None, block.get('links', ()))
+
+    @property
+    def all_text(self) -> str:
+        """All text content for analysis, joined once and cached"""
+        if self._all_text is None:
+            self._all_text = ' '.join(self._text_parts())
+        return self._all_text
+
+    @property
+    def total_text_length(self) -> int:
+        """Length of all_text without materializing the joined string"""
+        if self._all_text is not None:
+            return len(self._all_text)
+        total = count = 0
+        for part in self._text_parts():
+            total += len(part)
+            count += 1
+        return total + max(count - 1, 0)  # account for the join separators
+
     def get_all_text(self) -> str:
         """Get all text content for analysis"""
-        texts = [self.title, self.meta_description]
-        
-        for block in self.content_blocks:
-            texts.append(block.get('heading', ''))
-            texts.extend(block.get('paragraphs', []))
-            texts.extend(block.get('links', []))
-            
-        return ' '.join(filter(None, texts))
\ No newline at end of file
+        return self.all_text
+
+    @property
+    def text_preview(self) -> str:
+        """First 3000 chars of the page text"""
+        return self.all_text[:3000]
\ No newline at end of file
@@ -1,25 +1,30 @@
 # ui.py
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.io as pio
+import numpy as np
 import json
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
-import csv
 import base64
-from io import BytesIO
 
-# Import our modules
+# Import our modules. Only the light config/model modules load here;
+# the extractor/analyser/LLM stack (openai, bs4, requests, pandas...)
+# is imported inside get_components so cold starts and idle reruns
+# don't pay for machinery that only runs once Start Analysis is clicked
 from config import DEEPSEEK_API_KEY
-from models.data_models import KeywordData, DimensionHierarchy, ExtractedContent
-from extractors.aio_extractor import AIOExtractor
-from extractors.content_extractor import ContentExtractor
-from analysers.dimension_synthesiser import DimensionSynthesiser
-from analysers.gap_analyser import GapAnalyser
-from llm.deepseek_client import DeepSeekClient
-from utils.csv_parser import parse_keywords_csv
+from models.data_models import DimensionHierarchy, ExtractedContent, GapAnalysisResult
+
+# orjson serializes the analysis export several times faster than the
+# stdlib and emits bytes directly, which st.download_button accepts;
+# fall back transparently when absent
+try:
+    import orjson
+
+    def _dumps_indented(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indented(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
 # Page config
 st.set_page_config(
@@ -29,7 +34,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_MAIN_CSS = """
 <style>
     .progress-message {
         font-size: 1.1em;
@@ -53,6 +58,30 @@ st.markdown("""
         font-style: italic;
         color: #666;
     }
+    .kpi-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 16px;
+        margin: 10px 0;
+    }
+    .kpi-box {
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 12px 16px;
+    }
+    .kpi-label {
+        font-size: 0.9em;
+        color: #666;
+    }
+    .kpi-value {
+        font-size: 2em;
+        font-weight: bold;
+    }
+    .kpi-delta {
+        font-size: 0.85em;
+    }
+    .kpi-delta-good { color: #28a745; }
+    .kpi-delta-bad { color: #dc3545; }
     [data-testid="stDataFrame"] div[data-testid="stDataFrameResizable"] div[class*="dataframe"] div[class*="cell"] {
         white-space: normal !important;
         word-wrap: break-word !important;
@@ -71,9 +100,9 @@ st.markdown("""
         white-space: normal !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-st.markdown("""
+_PRINT_CSS = """
 <style>
 /* Print styles */
 @media print {
@@ -171,7 +200,25 @@ st.markdown("""
     background-color: #FF6B6B !important;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace to shrink the style payload"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    return re.sub(r'\s+', ' ', css).strip()
+
+
+# Cached so the CSS markdown elements are produced once per session and
+# replayed on reruns instead of being re-sent through Streamlit's differ;
+# minified once here so the replayed payload stays small
+@st.cache_resource
+def inject_css():
+    st.markdown(_minify_css(_MAIN_CSS), unsafe_allow_html=True)
+    st.markdown(_minify_css(_PRINT_CSS), unsafe_allow_html=True)
+
+
+inject_css()
 
 # Title
 st.title("🔍 Content Gap Analyser")
@@ -184,9 +231,69 @@ if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = {}
 
 
+# Indent strings per hierarchy depth, precomputed once instead of
+# re-multiplied for every dimension row in the report loops
+_MAX_INDENT_LEVEL = 6
+_HTML_INDENTS = ["&nbsp;" * (4 * i) for i in range(_MAX_INDENT_LEVEL + 1)]
+_TEXT_INDENTS = ["    " * i for i in range(_MAX_INDENT_LEVEL + 1)]
+
+
+# Row/recommendation templates for the report generators, hoisted to
+# module scope so the loops only substitute values
+_REPORT_ROW_TPL = """
+                    <tr style="border-bottom: 1px solid #f0f0f0;">
+                        <td style="padding: 16px 12px; vertical-align: top;">{name_html}</td>
+                        <td style="padding: 16px 12px; vertical-align: top;">
+                            <div style="display: flex; flex-direction: column; gap: 5px;">
+                                <div class="score-bar" style="width: 100px; height: 8px; background: #e0e0e0; border-radius: 4px; overflow: hidden;">
+                                    <div style="width: {score}%; height: 100%; background: #1C83E1; border-radius: 4px;"></div>
+                                </div>
+                                <span style="font-size: 0.85em; color: #666;">{score}%</span>
+                            </div>
+                        </td>
+                        <td style="padding: 16px 12px; vertical-align: top;">{status_html}</td>
+                        <td style="padding: 16px 12px; vertical-align: top; color: #555; font-size: 0.95em; line-height: 1.5;">{reasoning}</td>
+                        <td style="padding: 16px 12px; vertical-align: top; text-align: center; color: #666;">{coverage_html}</td>
+                    </tr>
+        """
+
+_DIMENSION_ROW_TPL = """
+        <div class="dimension-row">
+            <div class="dimension-name">{indent}{name}</div>
+            <div class="score-bar">
+                <div class="score-fill {fill_class}" style="width: {score}%"></div>
+            </div>
+            <span class="dimension-score score-{score_class}">{score}%</span>
+            <p style="margin: 10px 0; color: #666;">{reasoning}</p>
+        </div>
+        """
+
+_RECOMMENDATION_TPL = """
+        <div class="recommendation">
+            <strong>Priority {i}:</strong> {rec}
+        </div>
+        """
+
+_STRONG_BADGE = '<span style="background: #4CAF50; color: white; padding: 4px 12px; border-radius: 4px; font-size: 0.85em;">✅ Strong</span>'
+_WEAK_BADGE = '<span style="background: #FFECEC; color: red; padding: 4px 12px; border-radius: 4px; font-size: 0.85em;">❌ Needs Work</span>'
+
+
+def _hierarchy_cache_key(h: DimensionHierarchy):
+    """Hashable identity of a hierarchy for st.cache_data hash_funcs"""
+    return (h.key_word, tuple((item['level'], item['path']) for item in h.structured))
+
+
 # Helper function to create Plotly hierarchy graph
+# Cached so Streamlit reruns (every widget interaction re-executes this
+# script) reuse the built Figure instead of rebuilding nodes, edges and
+# layout. The hierarchy is hashed by its key word and structured items.
+@st.cache_data(hash_funcs={DimensionHierarchy: _hierarchy_cache_key})
 def create_hierarchy_graph(hierarchy: DimensionHierarchy):
     """Create an interactive Plotly network graph for the hierarchy"""
+    # Deferred: plotly is a heavy import and only needed once a chart is
+    # actually built, so the app's cold start doesn't pay for it
+    import plotly.graph_objects as go
+
     # Build node and edge lists
     nodes = []
     edges = []
@@ -202,12 +309,8 @@ def create_hierarchy_graph(hierarchy: DimensionHierarchy):
     })
     
     # Process structured hierarchy
-    level_counts = {0: 1, 1: 0, 2: 0, 3: 0}
-    
     for item in hierarchy.structured:
         if item['level'] > 0:
-            level_counts[item['level']] = level_counts.get(item['level'], 0) + 1
-            
             # Determine color and size based on level
             colors = ['#2563eb', '#7c3aed', '#ec4899', '#f59e0b']
             sizes = [40, 30, 20, 15]
@@ -228,36 +331,52 @@ def create_hierarchy_graph(hierarchy: DimensionHierarchy):
             else:
                 edges.append({'from': hierarchy.key_word, 'to': item['path']})
     
-    # Calculate positions using hierarchical layout
-    import math
-    for node in nodes:
-        level = node['level']
-        if level == 0:
-            node['x'] = 0
-            node['y'] = 0
+    # Tidy tree layout in one O(N) pass: leaves take consecutive x
+    # slots, each parent centres over its children, and depth maps to y.
+    # Unlike the old concentric rings this can't overlap siblings from
+    # different branches, however deep or wide the hierarchy gets
+    children = {}
+    for edge in edges:
+        children.setdefault(edge['from'], []).append(edge['to'])
+
+    x_by_id = {}
+    next_leaf_slot = iter(range(len(nodes)))
+
+    def place(node_id):
+        kids = children.get(node_id)
+        if kids:
+            x = sum(map(place, kids)) / len(kids)
         else:
-            # Arrange nodes in circles around center
-            count_at_level = sum(1 for n in nodes if n['level'] == level)
-            index_at_level = [n for n in nodes if n['level'] == level].index(node)
-            angle = (2 * math.pi * index_at_level) / count_at_level
-            radius = level * 150
-            node['x'] = radius * math.cos(angle)
-            node['y'] = radius * math.sin(angle)
+            x = next(next_leaf_slot)
+        x_by_id[node_id] = x
+        return x
+
+    place(hierarchy.key_word)
+
+    for node in nodes:
+        node['x'] = x_by_id.get(node['id'], 0) * 150
+        node['y'] = -node['level'] * 150
     
-    # Create Plotly figure
-    edge_trace = []
+    # Create Plotly figure. All edges go into a single trace (segments
+    # separated by None) - Plotly's render cost grows with trace count,
+    # so one trace per edge makes large hierarchies crawl
+    node_by_id = {node['id']: node for node in nodes}
+    edge_x = []
+    edge_y = []
     for edge in edges:
-        from_node = next(n for n in nodes if n['id'] == edge['from'])
-        to_node = next(n for n in nodes if n['id'] == edge['to'])
-        
-        edge_trace.append(go.Scatter(
-            x=[from_node['x'], to_node['x'], None],
-            y=[from_node['y'], to_node['y'], None],
-            mode='lines',
-            line=dict(width=1, color='#888'),
-            hoverinfo='none',
-            showlegend=False
-        ))
+        from_node = node_by_id[edge['from']]
+        to_node = node_by_id[edge['to']]
+        edge_x.extend((from_node['x'], to_node['x'], None))
+        edge_y.extend((from_node['y'], to_node['y'], None))
+
+    edge_trace = go.Scatter(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(width=1, color='#888'),
+        hoverinfo='none',
+        showlegend=False
+    )
     
     node_trace = go.Scatter(
         x=[node['x'] for node in nodes],
@@ -274,7 +393,7 @@ def create_hierarchy_graph(hierarchy: DimensionHierarchy):
         hovertext=[f"{node['label']}<br>Level {node['level']}" for node in nodes]
     )
     
-    fig = go.Figure(data=edge_trace + [node_trace])
+    fig = go.Figure(data=[edge_trace, node_trace])
     
     fig.update_layout(
         showlegend=False,
@@ -288,30 +407,41 @@ def create_hierarchy_graph(hierarchy: DimensionHierarchy):
     
     return fig
 
-def generate_pdf_report(results, hierarchy, plotly_fig):
-    """Generate PDF report content as HTML with embedded chart"""
-    good_dims = [ds for ds in results.dimension_scores if ds.score > 50]
-    poor_dims = [ds for ds in results.dimension_scores if ds.score <= 50]
-    coverage_pct = (len(good_dims) / len(results.dimension_scores) * 100) if results.dimension_scores else 0
-    
-    plotly_html = plotly_fig.to_html(
+# Serializing the figure to HTML walks the full trace data; cached so
+# rebuilding the report for new results reuses the fragment as long as
+# the hierarchy itself hasn't changed
+@st.cache_data(hash_funcs={DimensionHierarchy: _hierarchy_cache_key})
+def hierarchy_chart_html(hierarchy: DimensionHierarchy) -> str:
+    """Serialized chart fragment for the report, built once per hierarchy"""
+    return create_hierarchy_graph(hierarchy).to_html(
         div_id="hierarchy-chart",
         include_plotlyjs='cdn',
         config={'displayModeBar': False}
     )
+
+
+def generate_pdf_report(results, hierarchy, plotly_html):
+    """Generate PDF report content as HTML with embedded chart"""
+    # One vectorized pass over the scores instead of two filtering
+    # comprehensions that are only ever counted
+    scores = np.fromiter((ds.score for ds in results.dimension_scores), dtype=np.int16)
+    good_count = int((scores > 50).sum())
+    poor_count = scores.size - good_count
+    coverage_pct = (good_count / scores.size * 100) if scores.size else 0
     
     logo_html = ""
     logo_base64 = get_base64_logo()
     if logo_base64:
         logo_html = f'<img src="data:image/png;base64,{logo_base64}" alt="Logo" style="max-height: 60px; margin-bottom: 20px;">'
     
-    html_content = f"""
+    # Accumulate fragments and join once at the end - repeated += on a
+    # growing string is quadratic in total report size
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <title>Content Gap Analysis Report - {datetime.now().strftime('%Y-%m-%d')}</title>
-        <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
         <style>
             body {{ 
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif; 
@@ -466,11 +596,11 @@ def generate_pdf_report(results, hierarchy, plotly_fig):
                 </div>
                 <div class="metric-box">
                     <div class="metric-label">Strong Topics</div>
-                    <div class="metric-value">{len(good_dims)}</div>
+                    <div class="metric-value">{good_count}</div>
                 </div>
                 <div class="metric-box">
                     <div class="metric-label">Weak Topics</div>
-                    <div class="metric-value">{len(poor_dims)}</div>
+                    <div class="metric-value">{poor_count}</div>
                 </div>
                 <div class="metric-box">
                     <div class="metric-label">Coverage Rate</div>
@@ -501,66 +631,45 @@ def generate_pdf_report(results, hierarchy, plotly_fig):
                     </tr>
                 </thead>
                 <tbody>
-    """
-    
+    """]
+
     for ds in results.dimension_scores:
-        score_class = "high" if ds.score > 50 else "low"
-        path_parts = ds.dimension_path.split(' > ')
+        path_parts = ds.path_parts
         level = len(path_parts)
-        indent = "&nbsp;" * (4 * (level - 1))
-        
+        indent = _HTML_INDENTS[min(level - 1, _MAX_INDENT_LEVEL)]
+
         # Format dimension name based on level
         if level == 1:
             name_html = f"<strong>{path_parts[-1]}</strong>"
         else:
             name_html = f"{indent}└─ {path_parts[-1]}"
-        
-        # Status badge
-        if ds.score > 50:
-            status_html = '<span style="background: #4CAF50; color: white; padding: 4px 12px; border-radius: 4px; font-size: 0.85em;">✅ Strong</span>'
-        else:
-            status_html = '<span style="background: #FFECEC; color: red; padding: 4px 12px; border-radius: 4px; font-size: 0.85em;">❌ Needs Work</span>'
-        
-        # Coverage
-        coverage_html = ds.child_coverage if ds.child_coverage else "-"
-        
-        html_content += f"""
-                    <tr style="border-bottom: 1px solid #f0f0f0;">
-                        <td style="padding: 16px 12px; vertical-align: top;">{name_html}</td>
-                        <td style="padding: 16px 12px; vertical-align: top;">
-                            <div style="display: flex; flex-direction: column; gap: 5px;">
-                                <div class="score-bar" style="width: 100px; height: 8px; background: #e0e0e0; border-radius: 4px; overflow: hidden;">
-                                    <div style="width: {ds.score}%; height: 100%; background: {'#1C83E1' if ds.score > 50 else '#1C83E1'}; border-radius: 4px;"></div>
-                                </div>
-                                <span style="font-size: 0.85em; color: #666;">{ds.score}%</span>
-                            </div>
-                        </td>
-                        <td style="padding: 16px 12px; vertical-align: top;">{status_html}</td>
-                        <td style="padding: 16px 12px; vertical-align: top; color: #555; font-size: 0.95em; line-height: 1.5;">{ds.reasoning}</td>
-                        <td style="padding: 16px 12px; vertical-align: top; text-align: center; color: #666;">{coverage_html}</td>
-                    </tr>
-        """
-    
-    html_content += """
+
+        parts.append(_REPORT_ROW_TPL.format(
+            name_html=name_html,
+            score=ds.score,
+            status_html=_STRONG_BADGE if ds.score > 50 else _WEAK_BADGE,
+            reasoning=ds.reasoning,
+            coverage_html=ds.child_coverage if ds.child_coverage else "-"
+        ))
+
+    parts.append("""
                 </tbody>
             </table>
-            
+
             <div class="page-break"></div>
-            
+
             <h2>Strategic Recommendations</h2>
             <p style="color: #666; margin-bottom: 20px;">
                 Based on the gap analysis, here are prioritized recommendations to improve your content coverage:
             </p>
-    """
-    
-    for i, rec in enumerate(results.recommendations, 1):
-        html_content += f"""
-        <div class="recommendation">
-            <strong>Priority {i}:</strong> {rec}
-        </div>
-        """
-    
-    html_content += """
+    """)
+
+    parts.extend(
+        _RECOMMENDATION_TPL.format(i=i, rec=rec)
+        for i, rec in enumerate(results.recommendations, 1)
+    )
+
+    parts.append("""
             <div style="margin-top: 60px; padding-top: 30px; border-top: 2px solid #e0e0e0; text-align: center; color: #666;">
                 <p>This report was automatically generated by the Content Gap Analyzer</p>
                 <p>For questions or support, please contact your SEO team</p>
@@ -568,17 +677,21 @@ def generate_pdf_report(results, hierarchy, plotly_fig):
         </div>
     </body>
     </html>
-    """
-    
-    return html_content
+    """)
+
+    return ''.join(parts)
 
 def generate_pdf_report_without_chart(results, hierarchy):
     """Generate PDF report content as HTML without chart (fallback)"""
-    good_dims = [ds for ds in results.dimension_scores if ds.score > 50]
-    poor_dims = [ds for ds in results.dimension_scores if ds.score <= 50]
-    coverage_pct = (len(good_dims) / len(results.dimension_scores) * 100) if results.dimension_scores else 0
+    # One vectorized pass over the scores instead of two filtering
+    # comprehensions that are only ever counted
+    scores = np.fromiter((ds.score for ds in results.dimension_scores), dtype=np.int16)
+    good_count = int((scores > 50).sum())
+    poor_count = scores.size - good_count
+    coverage_pct = (good_count / scores.size * 100) if scores.size else 0
     
-    html_content = f"""
+    # Same list-and-join accumulation as generate_pdf_report
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -664,11 +777,11 @@ def generate_pdf_report_without_chart(results, hierarchy):
                 <div class="metric-label">Overall Score</div>
             </div>
             <div class="metric-box">
-                <div class="metric-value">{len(good_dims)}</div>
+                <div class="metric-value">{good_count}</div>
                 <div class="metric-label">Strong Topics</div>
             </div>
             <div class="metric-box">
-                <div class="metric-value">{len(poor_dims)}</div>
+                <div class="metric-value">{poor_count}</div>
                 <div class="metric-label">Weak Topics</div>
             </div>
             <div class="metric-box">
@@ -678,59 +791,182 @@ def generate_pdf_report_without_chart(results, hierarchy):
         </div>
         
         <h2>Topic Hierarchy</h2>
-        <div class="hierarchy-text">"""
-    
-    # Add text representation of hierarchy
-    def format_hierarchy(hierarchy):
-        lines = [hierarchy.key_word]
-        for item in hierarchy.structured:
-            if item['level'] > 0:
-                indent = "  " * (item['level'] - 1)
-                prefix = "└─ " if item['level'] == 1 else "  └─ "
-                lines.append(f"{indent}{prefix}{item['name']}")
-        return "\n".join(lines)
-    
-    html_content += format_hierarchy(hierarchy)
-    html_content += """</div>
-        
+        <div class="hierarchy-text">"""]
+
+    # Add text representation of hierarchy (shared memoized renderer)
+    parts.append(hierarchy_as_text(hierarchy))
+    parts.append("""</div>
+
         <div class="page-break"></div>
-        
+
         <h2>Detailed Topic Analysis</h2>
-    """
-    
+    """)
+
     for ds in results.dimension_scores:
-        score_class = "high" if ds.score > 50 else "low"
-        fill_class = "" if ds.score > 50 else "low"
-        path_parts = ds.dimension_path.split(' > ')
-        indent = "&nbsp;" * (4 * (len(path_parts) - 1))
-        
-        html_content += f"""
-        <div class="dimension-row">
-            <div class="dimension-name">{indent}{path_parts[-1]}</div>
-            <div class="score-bar">
-                <div class="score-fill {fill_class}" style="width: {ds.score}%"></div>
-            </div>
-            <span class="dimension-score score-{score_class}">{ds.score}%</span>
-            <p style="margin: 10px 0; color: #666;">{ds.reasoning}</p>
-        </div>
-        """
-    
-    html_content += """<div class="page-break"></div>"""
-    html_content += "<h2>Recommendations</h2>"
-    for i, rec in enumerate(results.recommendations, 1):
-        html_content += f"""
-        <div class="recommendation">
-            <strong>Priority {i}:</strong> {rec}
-        </div>
-        """
-    
-    html_content += """
+        path_parts = ds.path_parts
+        parts.append(_DIMENSION_ROW_TPL.format(
+            indent=_HTML_INDENTS[min(len(path_parts) - 1, _MAX_INDENT_LEVEL)],
+            name=path_parts[-1],
+            fill_class="" if ds.score > 50 else "low",
+            score=ds.score,
+            score_class="high" if ds.score > 50 else "low",
+            reasoning=ds.reasoning
+        ))
+
+    parts.append("""<div class="page-break"></div>""")
+    parts.append("<h2>Recommendations</h2>")
+    parts.extend(
+        _RECOMMENDATION_TPL.format(i=i, rec=rec)
+        for i, rec in enumerate(results.recommendations, 1)
+    )
+
+    parts.append("""
     </body>
     </html>
-    """
-    
-    return html_content
+    """)
+
+    return ''.join(parts)
+
+# Scores never change after an analysis, so the display DataFrame is
+# assembled once per analysis id rather than row-by-row on every rerun
+@st.cache_data(hash_funcs={GapAnalysisResult: lambda r: r.analysis_id})
+def build_scores_frame(results: GapAnalysisResult):
+    """Build the detailed-topic DataFrame shown in the results view"""
+    import pandas as pd
+
+    rows = []
+    for ds in results.dimension_scores:
+        path_parts = ds.path_parts
+        level = len(path_parts)
+        name = path_parts[-1] if level == 1 else _TEXT_INDENTS[min(level - 1, _MAX_INDENT_LEVEL)] + "└─ " + path_parts[-1]
+        rows.append({
+            "Topic": name,
+            "Score": ds.score / 100,
+            "Status": "✅ Strong" if ds.score > 50 else "❌ Needs Work",
+            "Analysis": ds.reasoning,
+            "Coverage": ds.child_coverage if ds.child_coverage else "-"
+        })
+    return pd.DataFrame(rows)
+
+
+# Assembling the full report - figure serialization plus one HTML row
+# per dimension - is the priciest thing in the results view, so it's
+# built once per analysis and reruns serve the cached bytes
+@st.cache_data(
+    show_spinner="Generating report...",
+    hash_funcs={
+        GapAnalysisResult: lambda r: r.analysis_id,
+        DimensionHierarchy: _hierarchy_cache_key
+    }
+)
+def build_report_bytes(results: GapAnalysisResult, hierarchy: DimensionHierarchy) -> bytes:
+    """Build the downloadable HTML report for an analysis"""
+    chart_html = hierarchy_chart_html(hierarchy)
+    return generate_pdf_report(results, hierarchy, chart_html).encode('utf-8')
+
+
+# The LLM client owns pooled HTTP connections and the extractors carry
+# their own session/cache state - build them once per process and reuse
+# across runs and sessions instead of reconstructing on every click
+@st.cache_resource
+def get_components():
+    """Construct the pipeline components shared by all analyses"""
+    from extractors.aio_extractor import AIOExtractor
+    from extractors.content_extractor import ContentExtractor
+    from analysers.dimension_synthesiser import DimensionSynthesiser
+    from analysers.gap_analyser import GapAnalyser
+    from llm.deepseek_client import DeepSeekClient
+
+    llm_client = DeepSeekClient(api_key=DEEPSEEK_API_KEY)
+    return (
+        llm_client,
+        AIOExtractor(),
+        ContentExtractor(),
+        DimensionSynthesiser(llm_client),
+        GapAnalyser(llm_client)
+    )
+
+
+# Parsing and fetching are pure functions of their inputs, so re-running
+# an analysis with the same upload or URL skips the work entirely; the
+# day-long TTL keeps stale page snapshots from being served forever.
+# cache_data returns a fresh copy per call, so the extraction step can
+# safely fill in raw_dimensions without touching the cached entry
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def parse_keywords_upload(raw_csv: bytes) -> list:
+    """Parse an uploaded keywords CSV, keyed on the raw file bytes"""
+    from utils.csv_parser import parse_keywords_csv
+    return parse_keywords_csv(raw_csv)
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def fetch_page_content(url: str) -> ExtractedContent:
+    """Fetch and structure a target page, keyed on the URL"""
+    _, _, content_extractor, _, _ = get_components()
+    return content_extractor.extract_from_url(url)
+
+
+# Memoized alongside the graph: the expander and the chartless report
+# both want the same text rendering, and fragment reruns shouldn't
+# rebuild it line by line each time
+@st.cache_data(hash_funcs={DimensionHierarchy: _hierarchy_cache_key})
+def hierarchy_as_text(hierarchy: DimensionHierarchy) -> str:
+    """Render the hierarchy as an indented text tree"""
+    lines = [hierarchy.key_word]
+    for item in hierarchy.structured:
+        if item['level'] > 0:
+            indent = "  " * (item['level'] - 1)
+            prefix = "└─ " if item['level'] == 1 else "  └─ "
+            lines.append(f"{indent}{prefix}{item['name']}")
+    return '\n'.join(lines)
 
+
+# Rendered as a fragment so interactions inside it (the expander, chart
+# zoom/pan) rerun only this block instead of the whole script, and the
+# serialized figure isn't re-sent over the websocket on every page rerun
+@st.fragment
+def show_hierarchy(hierarchy: DimensionHierarchy, chart_key: str):
+    """Display the hierarchy graph with a text fallback expander"""
+    st.header("📊 Dimension Hierarchy")
+    st.markdown("Here's how I've organized all the topics:")
+
+    fig = create_hierarchy_graph(hierarchy)
+    st.session_state.analysis_results['plotly_fig'] = fig
+    st.plotly_chart(fig, use_container_width=True, key=chart_key)
+
+    with st.expander("View as text"):
+        st.text(hierarchy_as_text(hierarchy))
+
+# Serializing the full analysis to indented JSON and assembling the TXT
+# summary are pure functions of the results, so cache them per analysis
+# id instead of rebuilding on every rerun of the results view
+@st.cache_data(hash_funcs={GapAnalysisResult: lambda r: r.analysis_id})
+def build_export_payloads(results: GapAnalysisResult, good_count: int, poor_count: int):
+    """Build the downloadable JSON and TXT summary for an analysis"""
+    results_json = _dumps_indented(results.to_json())
+
+    summary = f"""# Content Gap Analysis Report
+Generated: {results.created_at.strftime('%Y-%m-%d %H:%M')}
+
+
+## Overview
+- **URL Analyzed**: {results.target_url}
+- **Key Topic**: {results.key_word}
+- **Overall Score**: {results.overall_score}/100
+
+## Key Findings
+**Strengths**: {good_count} topics have good coverage
+**Weaknesses**: {poor_count} topics need improvement
+
+## Recommendations
+"""
+    summary += "".join(f"{i}. {rec}\n" for i, rec in enumerate(results.recommendations, 1))
+
+    return results_json, summary
+
+# Cached per process: the logo never changes, so the file read and
+# base64 encode happen once instead of on every rerun and every report
+@st.cache_resource
 def get_base64_logo(logo_path="assets/logo.png"):
     """Convert logo to base64 for embedding"""
     try:
@@ -739,6 +975,140 @@ def get_base64_logo(logo_path="assets/logo.png"):
     except:
         return None
 
+# The whole results view runs as one fragment: clicking a download
+# button or interacting with anything inside reruns just this
+# function instead of the full script (and the hierarchy chart)
+@st.fragment
+def render_results(results: GapAnalysisResult, hierarchy: DimensionHierarchy):
+    """Render the KPIs, score table, recommendations and exports"""
+    # One timestamp per analysis, taken from the result itself: the
+    # header label and export filenames stay stable across reruns
+    # instead of re-reading the clock on every interaction
+    ts_disp = results.created_at.strftime('%Y-%m-%d %H:%M')
+    ts_file = results.created_at.strftime('%Y%m%d_%H%M%S')
+
+    logo_base64 = get_base64_logo()
+    if logo_base64:
+        st.markdown(f"""
+        <div class="print-header">
+            <img src="data:image/png;base64,{logo_base64}" alt="Logo">
+            <h1>Content Gap Analysis Report</h1>
+            <p>Generated: {ts_disp}</p>
+            <p>URL: {results.target_url}</p>
+            <p>Key Topic: {results.key_word}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.header("📈 Gap Analysis Results")
+    
+    # Counts were computed once when the analysis finished
+    good_count = st.session_state.analysis_results['good_count']
+    poor_count = st.session_state.analysis_results['poor_count']
+    total_dims = len(results.dimension_scores)
+    coverage_pct = (good_count / total_dims * 100) if total_dims else 0
+
+    # KPIs: one markdown grid instead of four st.metric mounts in
+    # four st.columns - a single component for the static numbers,
+    # which also keeps the print CSS simple
+    st.markdown(f"""
+    <div class="keep-together kpi-grid">
+        <div class="kpi-box" title="Average coverage across all main topics">
+            <div class="kpi-label">Overall Score</div>
+            <div class="kpi-value">{results.overall_score}/100</div>
+        </div>
+        <div class="kpi-box">
+            <div class="kpi-label">✅ Strong Topics</div>
+            <div class="kpi-value">{good_count}</div>
+            <div class="kpi-delta kpi-delta-good">{good_count}/{total_dims}</div>
+        </div>
+        <div class="kpi-box">
+            <div class="kpi-label">❌ Weak Topics</div>
+            <div class="kpi-value">{poor_count}</div>
+            <div class="kpi-delta kpi-delta-bad">{poor_count}/{total_dims}</div>
+        </div>
+        <div class="kpi-box" title="Percentage of topics with good coverage">
+            <div class="kpi-label">Coverage %</div>
+            <div class="kpi-value">{coverage_pct:.0f}%</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
+
+    # Detailed Analysis Table
+    st.subheader("Detailed Topic Analysis")
+    st.markdown("Here's how well your content covers each main topic:")
+
+    # One st.dataframe instead of five widgets per dimension - the
+    # frontend virtualizes rows, so 100+ dimensions render as a
+    # single component rather than hundreds
+    st.dataframe(
+        build_scores_frame(results),
+        column_config={
+            "Score": st.column_config.ProgressColumn(
+                min_value=0, max_value=1, format="percent"
+            )
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
+    # Recommendations
+    st.subheader("💡 My Recommendations")
+    st.markdown("Based on the analysis, here's what I suggest you focus on:")
+    
+    for i, rec in enumerate(results.recommendations, 1):
+        st.info(f"**Priority {i}:** {rec}")
+    
+    # Download results
+    st.subheader("📥 Export Your Results")
+    
+    col1, col2, col3 = st.columns(3)
+
+    results_json_bytes, summary = build_export_payloads(results, good_count, poor_count)
+
+    with col1:
+        st.download_button(
+            label="📄 Download Full Analysis (JSON)",
+            data=results_json_bytes,
+            file_name=f"gap_analysis_{ts_file}.json",
+            mime="application/json"
+        )
+
+    with col2:
+        st.download_button(
+            label="📝 Download Summary (TXT)",
+            data=summary,
+            file_name=f"gap_analysis_summary_{ts_file}.txt",
+            mime="text/plain"
+        )
+
+    with col3:
+        try:
+            pdf_bytes = build_report_bytes(results, hierarchy)
+
+            st.download_button(
+                label="📑 Download Report (HTML)",
+                data=pdf_bytes,
+                file_name=f"content_gap_report_{ts_file}.html",
+                mime="text/html",
+                help="Download HTML report • Open in browser • Print to PDF (Ctrl+P)"
+            )
+        except Exception as e:
+            st.error(f"Error generating report: {str(e)}")
+            pdf_html = generate_pdf_report_without_chart(results, hierarchy)
+            pdf_bytes = pdf_html.encode('utf-8')
+            
+            st.download_button(
+                label="📑 Download Report (Text Only)",
+                data=pdf_bytes,
+                file_name=f"content_gap_report_{ts_file}.html",
+                mime="text/html",
+                help="Download report without charts"
+            )
+
+
 # Sidebar for inputs
 with st.sidebar:
     st.header("Configuration")
@@ -776,26 +1146,7 @@ results_container = st.container()
 
 if 'hierarchy' in st.session_state.analysis_results and st.session_state.analysis_stage >= 1 and not run_analysis:
     with hierarchy_container:
-        st.header("📊 Dimension Hierarchy")
-        st.markdown("Here's how I've organized all the topics:")
-        hierarchy = st.session_state.analysis_results['hierarchy']
-        
-        if 'plotly_fig' not in st.session_state.analysis_results:
-            fig = create_hierarchy_graph(hierarchy)
-            st.session_state.analysis_results['plotly_fig'] = fig
-        else:
-            fig = st.session_state.analysis_results['plotly_fig']
-        
-        st.plotly_chart(fig, use_container_width=True, key="hierarchy_chart_persistent")
-        
-        with st.expander("View as text"):
-            lines = [hierarchy.key_word]
-            for item in hierarchy.structured:
-                if item['level'] > 0:
-                    indent = "  " * (item['level'] - 1)
-                    prefix = "└─ " if item['level'] == 1 else "  └─ "
-                    lines.append(f"{indent}{prefix}{item['name']}")
-            st.text('\n'.join(lines))
+        show_hierarchy(st.session_state.analysis_results['hierarchy'], "hierarchy_chart_persistent")
 
 # Main analysis flow
 if run_analysis:
@@ -804,311 +1155,115 @@ if run_analysis:
     st.session_state.analysis_results = {}
     
     with progress_container:
-        progress_bar = st.progress(0)
-        message_placeholder = st.empty()
-        
         try:
-            # Initialize components
-            message_placeholder.markdown('<p class="progress-message">🚀 Starting up the analysis engine...</p>', unsafe_allow_html=True)
-            time.sleep(0.5)  # Brief pause for effect
-            
-            llm_client = DeepSeekClient(api_key=DEEPSEEK_API_KEY)
-            aio_extractor = AIOExtractor()
-            content_extractor = ContentExtractor()
-            synthesizer = DimensionSynthesiser(llm_client)
-            analyzer = GapAnalyser(llm_client)
-            
-            # Step 1: Parse CSV
-            progress_bar.progress(10)
-            message_placeholder.markdown('<p class="progress-message">📖 Let me read through your CSV file...</p>', unsafe_allow_html=True)
-            
-            file_content = uploaded_file.read().decode('utf-8')
-            keywords_data = parse_keywords_csv(file_content)
-            
-            message_placeholder.markdown(
-                f'<p class="progress-message step-complete">✓ Great! I found {len(keywords_data)} keywords to work with.</p>', 
-                unsafe_allow_html=True
-            )
-            time.sleep(0.5)
-            
-            # Step 2: Extract dimensions
-            progress_bar.progress(25)
-            message_placeholder.markdown(
-                f'<p class="progress-message">🔍 Now I\'m extracting key topics from each keyword\'s search results...</p>', 
-                unsafe_allow_html=True
-            )
-            
-            total_dimensions = 0
-            for i, kw_data in enumerate(keywords_data):
-                kw_data.raw_dimensions = aio_extractor.extract_dimensions(kw_data.aio_html)
-                total_dimensions += len(kw_data.raw_dimensions)
-            
-            message_placeholder.markdown(
-                f'<p class="progress-message step-complete">✓ Excellent! I extracted {total_dimensions} topics across all keywords.</p>', 
-                unsafe_allow_html=True
-            )
-            
-            # Step 3: Synthesize hierarchy
-            progress_bar.progress(40)
-            message_placeholder.markdown(
-                f'<p class="progress-message">🤖 I\'m using AI to organize these topics around "{key_word}". This might take a minute...</p>', 
-                unsafe_allow_html=True
-            )
-            
-            hierarchy = synthesizer.synthesize(key_word, keywords_data)
-            st.session_state.analysis_results['hierarchy'] = hierarchy
-            
-            message_placeholder.markdown(
-                '<p class="progress-message step-complete">✓ Perfect! I\'ve created a hierarchical structure of all the important topics.</p>', 
-                unsafe_allow_html=True
-            )
-            
-            # Display hierarchy immediately
-            with hierarchy_container:
-                st.header("📊 Dimension Hierarchy")
-                st.markdown("Here's how I've organized all the topics:")
-                
-                # Create and display Plotly graph
-                fig = create_hierarchy_graph(hierarchy)
-                st.plotly_chart(fig, use_container_width=True, key="hierarchy_chart_analysis")
-                st.session_state.analysis_results['plotly_fig'] = fig
-                
-                # Also show text representation
-                with st.expander("View as text"):
-                    st.text(synthesizer.visualize_hierarchy(hierarchy))
-            
-            # Step 4: Extract content
-            progress_bar.progress(60)
-            message_placeholder.markdown(
-                f'<p class="progress-message">🌐 Now fetching and analyzing content from {target_url}...</p>', 
-                unsafe_allow_html=True
-            )
-            
-            content = content_extractor.extract_from_url(target_url)
-            st.session_state.analysis_results['content'] = content
-            
-            message_placeholder.markdown(
-                '<p class="progress-message step-complete">✓ Got it! I\'ve extracted and structured your page content.</p>', 
-                unsafe_allow_html=True
-            )
-            
-            # Display content preview
-            with content_container:
-                st.header("📄 Extracted Content Preview")
-                with st.expander("View extracted content structure"):
-                    st.json({
-                        "title": content.title,
-                        "meta_description": content.meta_description,
-                        "sections": len(content.content_blocks),
-                        "total_text_length": len(content.get_all_text())
-                    })
-            
-            # Step 5: Analyze gaps
-            progress_bar.progress(80)
-            message_placeholder.markdown(
-                '<p class="progress-message">🤔 Analyzing how well your content covers each topic. This is the detailed part...</p>', 
-                unsafe_allow_html=True
-            )
-            
-            analysis = analyzer.analyze(content, hierarchy, key_word)
-            st.session_state.analysis_results['analysis'] = analysis
-            
-            progress_bar.progress(100)
-            message_placeholder.markdown(
-                '<p class="progress-message step-complete">🎉 All done! Here\'s what I found:</p>', 
-                unsafe_allow_html=True
-            )
-            
-            # Store completion
-            st.session_state.analysis_stage = 2
-            
-        except Exception as e:
-            st.error(f"❌ Oops! Something went wrong: {str(e)}")
-            st.info("💡 Check that your CSV format is correct and your URL is accessible.")
+            # st.status batches step updates into one collapsible log
+            # instead of re-rendering a placeholder per message
+            with st.status("🚀 Starting up the analysis engine...", expanded=True) as status:
+                # Initialize components (cached across runs and sessions)
+                llm_client, aio_extractor, content_extractor, synthesizer, analyzer = get_components()
 
-# Display results if analysis is complete
-if st.session_state.analysis_stage == 2 and 'analysis' in st.session_state.analysis_results:
-    results = st.session_state.analysis_results['analysis']
-    hierarchy = st.session_state.analysis_results['hierarchy']
-    
-    with results_container:
-        logo_base64 = get_base64_logo()
-        if logo_base64:
-            st.markdown(f"""
-            <div class="print-header">
-                <img src="data:image/png;base64,{logo_base64}" alt="Logo">
-                <h1>Content Gap Analysis Report</h1>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-                <p>URL: {results.target_url}</p>
-                <p>Key Topic: {results.key_word}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.header("📈 Gap Analysis Results")
-        
-        st.markdown('<div class="keep-together">', unsafe_allow_html=True)
-        # KPIs
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Overall Score",
-                f"{results.overall_score}/100",
-                help="Average coverage across all main topics"
-            )
-        
-        good_dims = [ds for ds in results.dimension_scores if ds.score > 50]
-        poor_dims = [ds for ds in results.dimension_scores if ds.score <= 50]
-        
-        with col2:
-            st.metric(
-                "✅ Strong Topics",
-                len(good_dims),
-                delta=f"{len(good_dims)}/{len(results.dimension_scores)}",
-                delta_color="normal"
-            )
-        
-        with col3:
-            st.metric(
-                "❌ Weak Topics",
-                len(poor_dims),
-                delta=f"{len(poor_dims)}/{len(results.dimension_scores)}",
-                delta_color="inverse"
-            )
-        
-        with col4:
-            coverage_pct = (len(good_dims) / len(results.dimension_scores) * 100) if results.dimension_scores else 0
-            st.metric(
-                "Coverage %",
-                f"{coverage_pct:.0f}%",
-                help="Percentage of topics with good coverage"
-            )
-
-        st.markdown('</div>', unsafe_allow_html=True)
+                # Step 1: Parse CSV
+                status.update(label="📖 Reading through your CSV file...")
 
-        st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
+                # Keyed on the raw upload bytes: re-running the analysis
+                # with the same file reuses the parsed keywords
+                keywords_data = parse_keywords_upload(uploaded_file.getvalue())
+                st.write(f"✓ Found {len(keywords_data)} keywords to work with.")
 
-        # Detailed Analysis Table
-        st.subheader("Detailed Topic Analysis")
-        st.markdown("Here's how well your content covers each main topic:")
+                # Step 2: Extract dimensions
+                status.update(label="🔍 Extracting key topics from each keyword's search results...")
 
-        # Use columns for better display
-        for ds in results.dimension_scores:
-            path_parts = ds.dimension_path.split(' > ')
-            level = len(path_parts)
-            
-            # Create columns
-            col1, col2, col3, col4, col5 = st.columns([3, 1, 1, 4, 1])
-            
-            with col1:
-                # Format dimension name based on level
-                if level == 1:
-                    st.markdown(f"**{path_parts[-1]}**")
+                # Extraction is independent per keyword and dominated by HTML
+                # parsing (bs4/lxml release the GIL in C code), so fan it out
+                # across threads instead of iterating serially; a lone
+                # keyword skips the pool overhead
+                total_dimensions = 0
+                if len(keywords_data) == 1:
+                    kw_data = keywords_data[0]
+                    kw_data.raw_dimensions = aio_extractor.extract_dimensions(kw_data.aio_html)
+                    total_dimensions = len(kw_data.raw_dimensions)
                 else:
-                    indent = "&nbsp;" * (4 * (level-1))
-                    st.markdown(f"{indent}└─ {path_parts[-1]}", unsafe_allow_html=True)
-            
-            with col2:
-                # Score with progress bar
-                st.progress(ds.score / 100)
-                st.caption(f"{ds.score}%")
-            
-            with col3:
-                # Status
-                if ds.score > 50:
-                    st.success("✅ Strong")
-                else:
-                    st.error("❌ Needs Work")
-            
-            with col4:
-                # Analysis reasoning
-                st.write(ds.reasoning)
-            
-            with col5:
-                # Coverage
-                st.write(ds.child_coverage if ds.child_coverage else "-")
-            
-            # Add separator
-            st.markdown("---")
-        
-        st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
-        # Recommendations
-        st.subheader("💡 My Recommendations")
-        st.markdown("Based on the analysis, here's what I suggest you focus on:")
-        
-        for i, rec in enumerate(results.recommendations, 1):
-            st.info(f"**Priority {i}:** {rec}")
-        
-        # Download results
-        st.subheader("📥 Export Your Results")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            results_json = results.to_json()
-            st.download_button(
-                label="📄 Download Full Analysis (JSON)",
-                data=json.dumps(results_json, indent=2),
-                file_name=f"gap_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
-        
-        with col2:
-            # Create summary report
-            summary = f"""# Content Gap Analysis Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        futures = {
+                            executor.submit(aio_extractor.extract_dimensions, kw_data.aio_html): kw_data
+                            for kw_data in keywords_data
+                        }
+                        for future in as_completed(futures):
+                            kw_data = futures[future]
+                            kw_data.raw_dimensions = future.result()
+                            total_dimensions += len(kw_data.raw_dimensions)
 
+                st.write(f"✓ Extracted {total_dimensions} topics across all keywords.")
 
-## Overview
-- **URL Analyzed**: {results.target_url}
-- **Key Topic**: {results.key_word}
-- **Overall Score**: {results.overall_score}/100
+                # Step 3: Synthesize hierarchy. The target-page fetch (Step 4)
+                # shares no inputs with synthesis, so it starts in the
+                # background here and the network wait overlaps the LLM call -
+                # total latency is the slower of the two, not the sum
+                fetch_executor = ThreadPoolExecutor(max_workers=1)
+                content_future = fetch_executor.submit(
+                    fetch_page_content, target_url
+                )
 
-## Key Findings
-**Strengths**: {len(good_dims)} topics have good coverage
-**Weaknesses**: {len(poor_dims)} topics need improvement
+                status.update(label=f'🤖 Organizing topics around "{key_word}". This might take a minute...')
 
-## Recommendations
-"""
-            for i, rec in enumerate(results.recommendations, 1):
-                summary += f"{i}. {rec}\n"
-            
-            st.download_button(
-                label="📝 Download Summary (TXT)",
-                data=summary,
-                file_name=f"gap_analysis_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                mime="text/plain"
-            )
+                hierarchy = synthesizer.synthesize(key_word, keywords_data)
+                st.session_state.analysis_results['hierarchy'] = hierarchy
+                st.write("✓ Created a hierarchical structure of all the important topics.")
 
-        with col3:
-            try:
-                plotly_fig = st.session_state.analysis_results.get('plotly_fig')
-                if plotly_fig:
-                    fig_copy = go.Figure(plotly_fig)
-                    pdf_html = generate_pdf_report(results, hierarchy, fig_copy)
-                    pdf_bytes = pdf_html.encode('utf-8')
-                    
-                    st.download_button(
-                        label="📑 Download Report (HTML)",
-                        data=pdf_bytes,
-                        file_name=f"content_gap_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                        mime="text/html",
-                        help="Download HTML report • Open in browser • Print to PDF (Ctrl+P)"
-                    )
-                else:
-                    st.error("Chart not available for export")
-            except Exception as e:
-                st.error(f"Error generating report: {str(e)}")
-                pdf_html = generate_pdf_report_without_chart(results, hierarchy)
-                pdf_bytes = pdf_html.encode('utf-8')
-                
-                st.download_button(
-                    label="📑 Download Report (Text Only)",
-                    data=pdf_bytes,
-                    file_name=f"content_gap_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                    mime="text/html",
-                    help="Download report without charts"
+                # Display hierarchy immediately
+                with hierarchy_container:
+                    show_hierarchy(hierarchy, "hierarchy_chart_analysis")
+
+                # Step 4: Extract content
+                status.update(label=f"🌐 Fetching and analyzing content from {target_url}...")
+
+                content = content_future.result()
+                fetch_executor.shutdown()
+                st.session_state.analysis_results['content'] = content
+                st.write("✓ Extracted and structured your page content.")
+
+                # Display content preview
+                with content_container:
+                    st.header("📄 Extracted Content Preview")
+                    with st.expander("View extracted content structure"):
+                        st.json({
+                            "title": content.title,
+                            "meta_description": content.meta_description,
+                            "sections": len(content.content_blocks),
+                            "total_text_length": content.total_text_length
+                        })
+
+                # Step 5: Analyze gaps
+                status.update(label="🤔 Analyzing how well your content covers each topic. This is the detailed part...")
+
+                analysis = analyzer.analyze(content, hierarchy, key_word)
+                st.session_state.analysis_results['analysis'] = analysis
+
+                # Split dimensions into strong/weak once; the KPI metrics and
+                # summary re-read these counts on every rerun of the results view
+                scores = np.fromiter(
+                    (ds.score for ds in analysis.dimension_scores), dtype=np.int16
                 )
+                good_count = int((scores > 50).sum())
+                st.session_state.analysis_results['good_count'] = good_count
+                st.session_state.analysis_results['poor_count'] = len(scores) - good_count
+
+                status.update(label="🎉 All done! Here's what I found:", state="complete", expanded=False)
+
+            # Store completion
+            st.session_state.analysis_stage = 2
+
+        except Exception as e:
+            st.error(f"❌ Oops! Something went wrong: {str(e)}")
+            st.info("💡 Check that your CSV format is correct and your URL is accessible.")
+
+# Display results if analysis is complete
+if st.session_state.analysis_stage == 2 and 'analysis' in st.session_state.analysis_results:
+    with results_container:
+        render_results(
+            st.session_state.analysis_results['analysis'],
+            st.session_state.analysis_results['hierarchy']
+        )
 
 # Default view when no analysis is running
 elif st.session_state.analysis_stage == 0: